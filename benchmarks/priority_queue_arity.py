@@ -0,0 +1,109 @@
+"""
+Benchmarks PriorityQueue with different heap arities.
+
+Each workload is timed for every arity, with the default comparer and with
+a custom comparer, and the best of several runs is reported in seconds.
+Run from the project root with `make bench`.
+"""
+
+import random
+import time
+
+from typing import Callable, List, Optional
+
+from src.datastructpy import BaseComparer, PriorityQueue
+
+
+ARITIES = (2, 3, 4, 8)
+SIZE = 100_000
+REPEAT = 3
+
+
+class CustomComparer(BaseComparer[float]):
+    """
+    A comparer with the same ordering as the default one, which disables
+    the `heapq` fast path.
+    """
+
+    def eq(self, value1: float, value2: float) -> bool:
+        return value1 == value2
+
+    def lt(self, value1: float, value2: float) -> bool:
+        return value1 < value2
+
+
+def new_queue(arity: int, custom: bool) -> PriorityQueue[float, int]:
+    queue = PriorityQueue[float, int](arity=arity)
+
+    if custom:
+        queue.comparer = CustomComparer()
+
+    return queue
+
+
+def enqueue_heavy(priorities: List[float], arity: int, custom: bool) -> None:
+    queue = new_queue(arity, custom)
+
+    for i, priority in enumerate(priorities):
+        queue.enqueue(priority, i)
+
+    queue.dequeue_many(len(priorities) // 10)
+
+
+def balanced(priorities: List[float], arity: int, custom: bool) -> None:
+    queue = new_queue(arity, custom)
+
+    for i, priority in enumerate(priorities):
+        queue.enqueue(priority, i)
+
+    queue.dequeue_many(len(priorities))
+
+
+def descending(priorities: List[float], arity: int, custom: bool) -> None:
+    queue = new_queue(arity, custom)
+
+    for i, priority in enumerate(sorted(priorities, reverse=True)):
+        queue.enqueue(priority, i)
+
+    queue.dequeue_many(len(priorities) // 10)
+
+
+def measure(
+    workload: Callable[[List[float], int, bool], None],
+    priorities: List[float],
+    arity: int,
+    custom: bool,
+) -> float:
+    best: Optional[float] = None
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        workload(priorities, arity, custom)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best or 0.0
+
+
+def main() -> None:
+    random.seed(0)
+    priorities = [random.random() for _ in range(SIZE)]
+    workloads = {
+        "enqueue-heavy": enqueue_heavy,
+        "balanced": balanced,
+        "descending-input": descending,
+    }
+
+    header = "".join(f"{f'd={arity}':>10}" for arity in ARITIES)
+    print(f"{'workload':<28}{header}")
+
+    for name, workload in workloads.items():
+        for custom in (False, True):
+            label = f"{name} ({'custom' if custom else 'default'})"
+            times = [measure(workload, priorities, arity, custom) for arity in ARITIES]
+            row = "".join(f"{elapsed:>10.3f}" for elapsed in times)
+            print(f"{label:<28}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,70 @@
 # pylint: disable=missing-module-docstring
 
+from .addressable_priority_queue import (
+    AddressablePriorityQueue,
+    PriorityQueueHandle,
+)
+from .async_priority_queue import AsyncPriorityQueue
 from .base_comparer import BaseComparer, DefaultComparer
-from .exceptions import EmptyCollectionException
-from .hash_table import HashTable
+from .blocking_priority_queue import BlockingPriorityQueue
+from .blocking_queue import BlockingQueue
+from .compact_hash_table import CompactHashTable
+from .concurrent_hash_table import ConcurrentHashTable
+from .exceptions import (
+    ClosedCollectionException,
+    EmptyCollectionException,
+    FullCollectionException,
+)
+from .hash_table import (
+    HashTable,
+    HashTableItemsView,
+    HashTableKeysView,
+    HashTableStats,
+    HashTableValuesView,
+)
 from .linked_list import LinkedList, LinkedListNode
+from .lru_cache import LRUCache, memoize
+from .mapped_hash_table import MappedHashTable
+from .numeric_priority_queue import NumericPriorityQueue
+from .pairing_heap import PairingHeap, PairingHeapNode
 from .priority_queue import PriorityQueue
 from .queue import Queue
 from .stack import Stack
+from .timer_scheduler import TimerHandle, TimerScheduler
+from .typed_queue import TypedQueue
+from .typed_stack import TypedStack
 
 __all__ = [
+    "AddressablePriorityQueue",
+    "AsyncPriorityQueue",
     "BaseComparer",
+    "BlockingPriorityQueue",
+    "BlockingQueue",
+    "ClosedCollectionException",
+    "CompactHashTable",
+    "ConcurrentHashTable",
     "DefaultComparer",
     "EmptyCollectionException",
+    "FullCollectionException",
     "HashTable",
+    "HashTableItemsView",
+    "HashTableKeysView",
+    "HashTableStats",
+    "HashTableValuesView",
     "LinkedList",
     "LinkedListNode",
+    "LRUCache",
+    "MappedHashTable",
+    "NumericPriorityQueue",
+    "PairingHeap",
+    "PairingHeapNode",
     "PriorityQueue",
+    "PriorityQueueHandle",
     "Stack",
     "Queue",
+    "TimerHandle",
+    "TimerScheduler",
+    "TypedQueue",
+    "TypedStack",
+    "memoize",
 ]
@@ -0,0 +1,44 @@
+"""
+Contains helpers shared by the blocking collections.
+"""
+
+import threading
+import time
+
+from typing import Callable, Optional
+
+
+def wait_while(
+    condition: threading.Condition,
+    blocked: Callable[[], bool],
+    block: bool,
+    timeout: Optional[float],
+) -> bool:
+    """
+    Waits on the condition while `blocked` returns `True`. Returns
+    `False` if the wait is not allowed or times out.
+    """
+
+    if not block:
+        return not blocked()
+
+    if timeout is None:
+        while blocked():
+            condition.wait()
+
+        return True
+
+    if timeout < 0:
+        raise ValueError("Timeout should be a non-negative number.")
+
+    deadline = time.monotonic() + timeout
+
+    while blocked():
+        remaining = deadline - time.monotonic()
+
+        if remaining <= 0:
+            return False
+
+        condition.wait(remaining)
+
+    return True
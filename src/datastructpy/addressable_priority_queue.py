@@ -0,0 +1,273 @@
+"""
+Contains a min-heap-based priority queue with handles to its elements.
+"""
+
+# pylint: disable=protected-access
+
+from operator import lt as default_lt
+from typing import Callable, Generic, List, Optional, TypeVar, final
+
+from .base_comparer import BaseComparer, DefaultComparer
+from .exceptions import EmptyCollectionException
+from .protocols import Comparable
+
+
+P = TypeVar("P", bound=Comparable)
+T = TypeVar("T", bound=Comparable)
+
+
+@final
+class PriorityQueueHandle(Generic[P, T]):
+    """
+    Represents an element of an addressable priority queue.
+    """
+
+    __slots__ = ("_priority", "_index", "_queue", "value")
+
+    def __init__(
+        self,
+        priority: P,
+        value: T,
+        index: int,
+        queue: "AddressablePriorityQueue[P, T]",
+    ) -> None:
+        """
+        Initializes a new handle at the given heap index.
+        """
+
+        self._priority: P = priority
+        self._index: int = index
+        self._queue: Optional["AddressablePriorityQueue[P, T]"] = queue
+
+        self.value: T = value
+
+    @property
+    def priority(self) -> P:
+        """
+        Returns the priority of the element.
+        """
+
+        return self._priority
+
+    @property
+    def queue(self) -> Optional["AddressablePriorityQueue[P, T]"]:
+        """
+        Returns the queue the element belongs to, or `None`
+        if it was removed.
+        """
+
+        return self._queue
+
+
+class AddressablePriorityQueue(Generic[P, T]):
+    """
+    Represents a min-heap-based priority queue whose `enqueue` returns
+    a handle, which can be used to update the priority of the element
+    or to remove it in logarithmic time.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new priority queue.
+        """
+
+        self._comparer: Optional[BaseComparer[P]] = None
+        self._lt: Callable[[P, P], bool] = default_lt
+        self._heap: List[PriorityQueueHandle[P, T]] = []
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the queue.
+        """
+
+        return len(self._heap)
+
+    @property
+    def comparer(self) -> BaseComparer[P]:
+        """
+        Returns the comparer used to evaluate equality of values.
+        """
+
+        if not self._comparer:
+            self._comparer = DefaultComparer[P]()
+
+        return self._comparer
+
+    @comparer.setter
+    def comparer(self, comparer: object) -> None:
+        """
+        Sets the custom comparer, and restores the heap order
+        of the elements already in the queue.
+        """
+
+        if not isinstance(comparer, BaseComparer):
+            raise ValueError("Comparer should be an instance of BaseComparer.")
+
+        self._comparer = comparer
+        self._lt = comparer.lt
+
+        for index in reversed(range(len(self._heap) // 2)):
+            self._sift_down(index)
+
+    @property
+    def id(self) -> int:
+        """
+        Returns a unique identifier for this queue.
+        """
+
+        return id(self)
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the queue.
+        """
+
+        for handle in self._heap:
+            handle._queue = None
+
+        self._heap = []
+
+    def contains(self, handle: PriorityQueueHandle[P, T]) -> bool:
+        """
+        Returns `True` if the handle refers to an element of this queue.
+        """
+
+        return handle._queue is self
+
+    def dequeue(self) -> T:
+        """
+        Removes and returns the object at the beginning of the queue.
+        """
+
+        if not self._heap:
+            raise EmptyCollectionException("The queue is empty!")
+
+        return self._remove_at(0).value
+
+    def enqueue(self, priority: P, value: T) -> PriorityQueueHandle[P, T]:
+        """
+        Adds an object to the queue, and returns its handle.
+        """
+
+        handle = PriorityQueueHandle(priority, value, len(self._heap), self)
+        self._heap.append(handle)
+        self._sift_up(handle._index)
+
+        return handle
+
+    def peek(self) -> T:
+        """
+        Returns the object at the beginning of the queue without removing it.
+        """
+
+        if not self._heap:
+            raise EmptyCollectionException("The queue is empty!")
+
+        return self._heap[0].value
+
+    def remove(self, handle: PriorityQueueHandle[P, T]) -> T:
+        """
+        Removes the element referred to by the handle, and returns its value.
+        """
+
+        self._validate_handle(handle)
+
+        return self._remove_at(handle._index).value
+
+    # pylint: disable-next=line-too-long
+    def update_priority(self, handle: PriorityQueueHandle[P, T], priority: P) -> None:
+        """
+        Changes the priority of the element referred to by the handle.
+        """
+
+        self._validate_handle(handle)
+
+        handle._priority = priority
+        self._sift_up(handle._index)
+        self._sift_down(handle._index)
+
+    def _remove_at(self, index: int) -> PriorityQueueHandle[P, T]:
+        """
+        Removes the element at the given heap index, and moves the last
+        element into its place.
+        """
+
+        heap = self._heap
+        handle = heap[index]
+        last = heap.pop()
+
+        if last is not handle:
+            heap[index] = last
+            last._index = index
+            self._sift_up(index)
+            self._sift_down(last._index)
+
+        handle._queue = None
+
+        return handle
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Moves the element at the given index up, shifting the parents
+        it passes down into the hole it leaves.
+        """
+
+        heap = self._heap
+        lt = self._lt
+        handle = heap[index]
+        priority = handle._priority
+
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_handle = heap[parent]
+
+            if not lt(priority, parent_handle._priority):
+                break
+
+            heap[index] = parent_handle
+            parent_handle._index = index
+            index = parent
+
+        heap[index] = handle
+        handle._index = index
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Moves the element at the given index down, shifting the children
+        it passes up into the hole it leaves.
+        """
+
+        heap = self._heap
+        lt = self._lt
+        size = len(heap)
+        handle = heap[index]
+        priority = handle._priority
+        child = 2 * index + 1
+
+        while child < size:
+            right = child + 1
+
+            # pylint: disable-next=line-too-long
+            if right < size and lt(heap[right]._priority, heap[child]._priority):
+                child = right
+
+            child_handle = heap[child]
+
+            if not lt(child_handle._priority, priority):
+                break
+
+            heap[index] = child_handle
+            child_handle._index = index
+            index = child
+            child = 2 * index + 1
+
+        heap[index] = handle
+        handle._index = index
+
+    def _validate_handle(self, handle: PriorityQueueHandle[P, T]) -> None:
+        """
+        Validates that the handle refers to an element of this queue.
+        """
+
+        if handle._queue is not self:
+            raise ValueError("The handle does not belong to this queue.")
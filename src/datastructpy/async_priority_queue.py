@@ -0,0 +1,185 @@
+"""
+Contains a priority queue with awaitable operations for asyncio.
+"""
+
+import asyncio
+
+from collections import deque
+from typing import Deque, Generic, TypeVar
+
+from .base_comparer import BaseComparer
+from .exceptions import EmptyCollectionException, FullCollectionException
+from .priority_queue import PriorityQueue
+from .protocols import Comparable
+
+
+P = TypeVar("P", bound=Comparable)
+T = TypeVar("T", bound=Comparable)
+
+
+class AsyncPriorityQueue(Generic[P, T]):
+    """
+    Represents a priority queue for coroutines of a single event loop.
+
+    `get` waits while the queue is empty, and, when `maxsize` is positive,
+    `put` waits while the queue is full. `task_done` and `join` track
+    the completion of dequeued elements.
+    """
+
+    def __init__(self, maxsize: int = 0, arity: int = 2) -> None:
+        """
+        Initializes a new priority queue holding at most `maxsize`
+        elements, or any number of elements if `maxsize` is not positive.
+        """
+
+        self._queue = PriorityQueue[P, T](arity=arity)
+        self._maxsize: int = maxsize
+        self._unfinished: int = 0
+        self._getters: Deque["asyncio.Future[None]"] = deque()
+        self._putters: Deque["asyncio.Future[None]"] = deque()
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the queue.
+        """
+
+        return len(self._queue)
+
+    @property
+    def comparer(self) -> BaseComparer[P]:
+        """
+        Returns the comparer used to evaluate equality of values.
+        """
+
+        return self._queue.comparer
+
+    @comparer.setter
+    def comparer(self, comparer: BaseComparer[P]) -> None:
+        """
+        Sets the custom comparer.
+        """
+
+        self._queue.comparer = comparer
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Returns the maximum number of elements in the queue,
+        or 0 if the queue is unbounded.
+        """
+
+        return self._maxsize
+
+    def full(self) -> bool:
+        """
+        Returns `True` if the queue holds `maxsize` elements.
+        """
+
+        return 0 < self._maxsize <= len(self._queue)
+
+    async def get(self) -> T:
+        """
+        Removes and returns the object at the beginning of the queue,
+        waiting until an element is available.
+        """
+
+        while not self._queue:
+            await self._wait(self._getters)
+
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        """
+        Removes and returns the object at the beginning of the queue,
+        or raises `EmptyCollectionException` if the queue is empty.
+        """
+
+        if not self._queue:
+            raise EmptyCollectionException("The queue is empty!")
+
+        value = self._queue.dequeue()
+        self._wakeup_next(self._putters)
+
+        return value
+
+    async def join(self) -> None:
+        """
+        Waits until every element put into the queue was dequeued
+        and marked as done with `task_done`.
+        """
+
+        if self._unfinished:
+            await self._finished.wait()
+
+    async def put(self, priority: P, value: T) -> None:
+        """
+        Adds an object to the queue, waiting until a slot is free.
+        """
+
+        while self.full():
+            await self._wait(self._putters)
+
+        self.put_nowait(priority, value)
+
+    def put_nowait(self, priority: P, value: T) -> None:
+        """
+        Adds an object to the queue, or raises `FullCollectionException`
+        if the queue is full.
+        """
+
+        if self.full():
+            raise FullCollectionException("The queue is full!")
+
+        self._queue.enqueue(priority, value)
+        self._unfinished += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    def task_done(self) -> None:
+        """
+        Marks a dequeued element as processed.
+        """
+
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times.")
+
+        self._unfinished -= 1
+
+        if not self._unfinished:
+            self._finished.set()
+
+    async def _wait(self, waiters: Deque["asyncio.Future[None]"]) -> None:
+        """
+        Parks the current coroutine in the given waiters queue until it is
+        woken up. A cancelled waiter passes its wake-up to the next one.
+        """
+
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                self._wakeup_next(waiters)
+
+            raise
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque["asyncio.Future[None]"]) -> None:
+        """
+        Wakes up the first waiter that is still waiting.
+        """
+
+        while waiters:
+            waiter = waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                break
@@ -0,0 +1,155 @@
+"""
+Contains a thread-safe priority queue with blocking operations.
+"""
+
+import threading
+
+from typing import Generic, Optional, TypeVar
+
+from ._blocking import wait_while
+from .base_comparer import BaseComparer
+from .exceptions import EmptyCollectionException, FullCollectionException
+from .priority_queue import PriorityQueue
+from .protocols import Comparable
+
+
+P = TypeVar("P", bound=Comparable)
+T = TypeVar("T", bound=Comparable)
+
+
+class BlockingPriorityQueue(Generic[P, T]):
+    """
+    Represents a thread-safe priority queue.
+
+    `get` blocks while the queue is empty, and, when `maxsize` is positive,
+    `put` blocks while the queue is full. `task_done` and `join` track
+    the completion of dequeued elements.
+    """
+
+    def __init__(self, maxsize: int = 0, arity: int = 2) -> None:
+        """
+        Initializes a new priority queue holding at most `maxsize`
+        elements, or any number of elements if `maxsize` is not positive.
+        """
+
+        self._queue = PriorityQueue[P, T](arity=arity)
+        self._maxsize: int = maxsize
+        self._unfinished: int = 0
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_done = threading.Condition(self._mutex)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the queue.
+        """
+
+        with self._mutex:
+            return len(self._queue)
+
+    @property
+    def comparer(self) -> BaseComparer[P]:
+        """
+        Returns the comparer used to evaluate equality of values.
+        """
+
+        with self._mutex:
+            return self._queue.comparer
+
+    @comparer.setter
+    def comparer(self, comparer: BaseComparer[P]) -> None:
+        """
+        Sets the custom comparer.
+        """
+
+        with self._mutex:
+            self._queue.comparer = comparer
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Returns the maximum number of elements in the queue,
+        or 0 if the queue is unbounded.
+        """
+
+        return self._maxsize
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns the object at the beginning of the queue.
+
+        Waits up to `timeout` seconds, or indefinitely if it is `None`,
+        for an element to become available, and raises
+        `EmptyCollectionException` if none does or `block` is `False`.
+        """
+
+        with self._not_empty:
+            if not wait_while(self._not_empty, self._empty, block, timeout):
+                raise EmptyCollectionException("The queue is empty!")
+
+            value = self._queue.dequeue()
+            self._not_full.notify()
+
+            return value
+
+    def join(self) -> None:
+        """
+        Blocks until every element put into the queue was dequeued
+        and marked as done with `task_done`.
+        """
+
+        with self._all_done:
+            while self._unfinished:
+                self._all_done.wait()
+
+    def put(
+        self,
+        priority: P,
+        value: T,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Adds an object to the queue.
+
+        Waits up to `timeout` seconds, or indefinitely if it is `None`,
+        for a free slot, and raises `FullCollectionException` if none
+        becomes available or `block` is `False`.
+        """
+
+        with self._not_full:
+            if not wait_while(self._not_full, self._full, block, timeout):
+                raise FullCollectionException("The queue is full!")
+
+            self._queue.enqueue(priority, value)
+            self._unfinished += 1
+            self._not_empty.notify()
+
+    def task_done(self) -> None:
+        """
+        Marks a dequeued element as processed.
+        """
+
+        with self._all_done:
+            if self._unfinished <= 0:
+                raise ValueError("task_done() called too many times.")
+
+            self._unfinished -= 1
+
+            if not self._unfinished:
+                self._all_done.notify_all()
+
+    def _empty(self) -> bool:
+        """
+        Checks whether the queue is empty. The mutex should be held.
+        """
+
+        return not self._queue
+
+    def _full(self) -> bool:
+        """
+        Checks whether the queue is full. The mutex should be held.
+        """
+
+        return 0 < self._maxsize <= len(self._queue)
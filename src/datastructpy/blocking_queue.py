@@ -0,0 +1,425 @@
+"""
+Contains a thread-safe FIFO (First-In-First-Out) queue with blocking
+operations.
+"""
+
+import threading
+
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from ._blocking import wait_while
+from .exceptions import (
+    ClosedCollectionException,
+    EmptyCollectionException,
+    FullCollectionException,
+)
+from .protocols import Comparable
+from .queue import Queue
+
+
+T = TypeVar("T", bound=Comparable)
+
+
+class BlockingQueue(Generic[T]):
+    """
+    Represents a thread-safe FIFO (First-In-First-Out) queue for multiple
+    producers and consumers.
+
+    `get` blocks while the queue is empty. A queue with a `maxlen` holds
+    at most `maxlen` elements: with the `reject` overflow policy `put`
+    blocks while the queue is full, and with the `overwrite` policy it
+    drops the oldest element, which counts as done. `enqeue` and `dequeue`
+    are the same operations under the names used by `Queue`.
+
+    Once the queue is closed, adding elements raises
+    `ClosedCollectionException`, and so does removing elements once
+    the remaining ones are consumed.
+    """
+
+    def __init__(
+        self,
+        values: Optional[List[T]] = None,
+        maxlen: Optional[int] = None,
+        overflow: str = "reject",
+    ) -> None:
+        """
+        Initializes a new queue instance.
+        """
+
+        self._queue: Queue[T] = Queue(values, maxlen, overflow)
+        self._closed: bool = False
+        self._unfinished: int = len(self._queue)
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_done = threading.Condition(self._mutex)
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates through a snapshot of the queue taken under the lock.
+        """
+
+        with self._mutex:
+            snapshot = self._queue.snapshot()
+
+        yield from snapshot
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the queue.
+        """
+
+        with self._mutex:
+            return len(self._queue)
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Retrieve the element at the specified index from the queue.
+        """
+
+        with self._mutex:
+            return self._queue[index]
+
+    @property
+    def closed(self) -> bool:
+        """
+        Returns `True` if the queue was closed.
+        """
+
+        return self._closed
+
+    @property
+    def id(self) -> int:
+        """
+        Returns a unique identifier for this queue.
+        """
+
+        return id(self)
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        """
+        Returns the maximum number of elements in the queue,
+        or `None` if the queue is unbounded.
+        """
+
+        return self._queue.maxlen
+
+    @property
+    def overflow(self) -> str:
+        """
+        Returns the policy applied when adding to a full queue.
+        """
+
+        return self._queue.overflow
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the queue, and marks them as done.
+        """
+
+        with self._mutex:
+            self._discard()
+
+    def close(self, immediate: bool = False) -> None:
+        """
+        Closes the queue, and wakes up all the blocked threads.
+        The remaining elements can still be removed, unless `immediate`
+        is `True`, in which case they are discarded.
+        """
+
+        with self._mutex:
+            self._closed = True
+
+            if immediate:
+                self._discard()
+
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def contains(self, value: T) -> bool:
+        """
+        Returns `True` if the queue contains the specified value.
+        """
+
+        with self._mutex:
+            return self._queue.contains(value)
+
+    def copy(self, deep: bool = False) -> List[T]:
+        """
+        Returns a new list with the values from the queue.
+        The values themselves are copied only if `deep` is `True`.
+        """
+
+        with self._mutex:
+            return self._queue.copy(deep)
+
+    def dequeue(
+        self, block: bool = True, timeout: Optional[float] = None
+    ) -> Optional[T]:
+        """
+        Removes and returns the object at the beginning of the queue.
+        Same as `get`.
+        """
+
+        return self.get(block, timeout)
+
+    def dequeue_many(self, count: int) -> List[T]:
+        """
+        Removes and returns up to `count` objects from the beginning
+        of the queue without waiting.
+        """
+
+        with self._mutex:
+            values = self._queue.dequeue_many(count)
+            self._not_full.notify(len(values))
+
+            return values
+
+    def drain(self) -> Iterator[T]:
+        """
+        Removes and yields objects from the beginning of the queue
+        until the queue is empty, without waiting.
+        """
+
+        while True:
+            with self._mutex:
+                if not self._queue:
+                    return
+
+                value = self._queue.dequeue()
+                self._not_full.notify()
+
+            yield value  # type: ignore[misc]
+
+    def enqeue(
+        self, value: T, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Adds an object to the end of the queue. Same as `put`.
+        """
+
+        self.put(value, block, timeout)
+
+    def enqueue_many(
+        self,
+        values: Iterable[T],
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Adds objects to the end of the queue. Same as `put_many`.
+        """
+
+        self.put_many(values, block, timeout)
+
+    def full(self) -> bool:
+        """
+        Returns `True` if the queue holds `maxlen` elements.
+        """
+
+        with self._mutex:
+            return self._queue.full()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns the object at the beginning of the queue.
+
+        Waits up to `timeout` seconds, or indefinitely if it is `None`,
+        for an element to become available, and raises
+        `EmptyCollectionException` if none does or `block` is `False`.
+        """
+
+        with self._not_empty:
+            self._wait_not_empty(block, timeout)
+
+            value = self._queue.dequeue()
+            self._not_full.notify()
+
+            return value  # type: ignore[return-value]
+
+    def get_many(
+        self,
+        count: int,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[T]:
+        """
+        Removes and returns up to `count` objects from the beginning
+        of the queue.
+
+        Waits like `get` for the first element only, then takes the
+        elements available at that moment with a single lock acquisition.
+        """
+
+        if count < 1:
+            raise ValueError("Count should be a positive integer.")
+
+        with self._not_empty:
+            self._wait_not_empty(block, timeout)
+
+            values = self._queue.dequeue_many(count)
+            self._not_full.notify(len(values))
+
+            return values
+
+    def join(self) -> None:
+        """
+        Blocks until every element put into the queue was dequeued
+        and marked as done with `task_done`.
+        """
+
+        with self._all_done:
+            while self._unfinished:
+                self._all_done.wait()
+
+    def peek(self) -> Optional[T]:
+        """
+        Returns the object at the beginning of the queue without removing it.
+        """
+
+        with self._mutex:
+            return self._queue.peek()
+
+    def put(
+        self, value: T, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Adds an object to the end of the queue.
+
+        Waits up to `timeout` seconds, or indefinitely if it is `None`,
+        for a free slot, and raises `FullCollectionException` if none
+        becomes available or `block` is `False`.
+        """
+
+        with self._not_full:
+            self._wait_not_full(block, timeout)
+            self._add([value])
+
+    def put_many(
+        self,
+        values: Iterable[T],
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Adds objects to the end of the queue.
+
+        With the `reject` policy, the objects are added in chunks that fit
+        into the free slots, waiting like `put` for slots to become free
+        before each chunk. The `timeout` applies to each wait, and the
+        objects added before an exception is raised stay in the queue.
+        """
+
+        pending = list(values)
+        maxlen = self._queue.maxlen
+
+        with self._not_full:
+            while pending:
+                self._wait_not_full(block, timeout)
+
+                free = len(pending)
+
+                if maxlen is not None and self._queue.overflow == "reject":
+                    free = min(free, maxlen - len(self._queue))
+
+                self._add(pending[:free])
+                del pending[:free]
+
+    def snapshot(self) -> "BlockingQueue[T]":
+        """
+        Returns a queue with the same elements in constant time.
+        It shares the buffer with this queue until either is modified.
+        """
+
+        with self._mutex:
+            snapshot = self._queue.snapshot()
+
+        clone = BlockingQueue[T](maxlen=self.maxlen, overflow=self.overflow)
+        # pylint: disable-next=protected-access
+        clone._queue = snapshot
+        # pylint: disable-next=protected-access
+        clone._unfinished = len(snapshot)
+
+        return clone
+
+    def task_done(self) -> None:
+        """
+        Marks a dequeued element as processed.
+        """
+
+        with self._all_done:
+            if self._unfinished <= 0:
+                raise ValueError("task_done() called too many times.")
+
+            self._unfinished -= 1
+
+            if not self._unfinished:
+                self._all_done.notify_all()
+
+    def _add(self, values: List[T]) -> None:
+        """
+        Adds objects that fit into the queue, and counts the ones dropped
+        by the `overwrite` policy as done. The mutex should be held.
+        """
+
+        size = len(self._queue)
+        self._queue.enqueue_many(values)
+        dropped = size + len(values) - len(self._queue)
+
+        self._unfinished += len(values) - dropped
+        self._not_empty.notify(len(values))
+
+        if dropped and not self._unfinished:
+            self._all_done.notify_all()
+
+    def _discard(self) -> None:
+        """
+        Removes all the elements, marks them as done, and wakes up
+        the blocked producers. The mutex should be held.
+        """
+
+        self._unfinished -= len(self._queue)
+        self._queue.clear()
+        self._not_full.notify_all()
+
+        if not self._unfinished:
+            self._all_done.notify_all()
+
+    def _empty(self) -> bool:
+        """
+        Checks whether `get` should wait. The mutex should be held.
+        """
+
+        return not self._closed and not self._queue
+
+    def _full(self) -> bool:
+        """
+        Checks whether `put` should wait. The mutex should be held.
+        """
+
+        queue = self._queue
+
+        return not self._closed and queue.overflow == "reject" and queue.full()
+
+    def _wait_not_empty(self, block: bool, timeout: Optional[float]) -> None:
+        """
+        Waits until an element is available. The mutex should be held.
+        """
+
+        if not wait_while(self._not_empty, self._empty, block, timeout):
+            raise EmptyCollectionException("The queue is empty!")
+
+        if not self._queue:
+            raise ClosedCollectionException("The queue is closed!")
+
+    def _wait_not_full(self, block: bool, timeout: Optional[float]) -> None:
+        """
+        Waits until a slot is free. The mutex should be held.
+        """
+
+        if not wait_while(self._not_full, self._full, block, timeout):
+            raise FullCollectionException("The queue is full!")
+
+        if self._closed:
+            raise ClosedCollectionException("The queue is closed!")
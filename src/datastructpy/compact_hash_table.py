@@ -0,0 +1,227 @@
+"""
+HashTable implementation using open addressing over compact storage.
+
+Entries live in dense, insertion-ordered arrays of hashes, keys and values,
+and a sparse index array maps probe slots to positions in those arrays,
+following the layout of the CPython `dict`.
+"""
+
+from array import array
+from collections.abc import Hashable
+from typing import Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from .protocols import Comparable
+
+
+T = TypeVar("T", bound=Comparable)
+
+_EMPTY = -1
+_DUMMY = -2
+_DELETED = object()
+_PERTURB_MASK = (1 << 64) - 1
+
+
+def _new_indices(capacity: int) -> "array[int]":
+    """
+    Creates an index array of the smallest integer type able to address
+    all entries of a table with the given capacity.
+    """
+
+    if capacity <= 1 << 7:
+        typecode = "b"
+    elif capacity <= 1 << 15:
+        typecode = "h"
+    elif capacity <= 1 << 31:
+        typecode = "i"
+    else:
+        typecode = "q"
+
+    return array(typecode, [_EMPTY]) * capacity
+
+
+class CompactHashTable(Generic[T]):
+    """
+    Represents a hash table with open addressing and compact storage.
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        """
+        Initializes the hash table with a given number of index slots.
+        The capacity is rounded up to a power of two.
+        """
+
+        if capacity < 1:
+            raise ValueError("Capacity should be a positive integer.")
+
+        size = 8
+
+        while size < capacity:
+            size *= 2
+
+        self._min_capacity: int = size
+        self._indices: "array[int]" = _new_indices(size)
+        self._hashes: "array[int]" = array("q")
+        self._keys: List[object] = []
+        self._values: List[Optional[T]] = []
+        self._count: int = 0
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over all values stored in the hash table,
+        in insertion order.
+        """
+
+        for key, value in zip(self._keys, self._values):
+            if key is not _DELETED:
+                yield value  # type: ignore[misc]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements stored in the hash table.
+        """
+
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the number of index slots of the hash table.
+        """
+
+        return len(self._indices)
+
+    def add(self, key: Hashable, value: T) -> None:
+        """
+        Adds a key-value pair to the hash table.
+        Updates the value if the key already exists.
+        """
+
+        hash_code = hash(key)
+        slot, index = self._lookup(key, hash_code)
+
+        if index >= 0:
+            self._values[index] = value
+            return
+
+        if len(self._keys) >= len(self._indices) * 2 // 3:
+            self._resize()
+            slot, _ = self._lookup(key, hash_code)
+
+        self._indices[slot] = len(self._keys)
+        self._hashes.append(hash_code)
+        self._keys.append(key)
+        self._values.append(value)
+        self._count += 1
+
+    def contains(self, key: Hashable) -> bool:
+        """
+        Checks whether a key exists in the hash table.
+        """
+
+        return self._lookup(key, hash(key))[1] >= 0
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the hash table, and restores
+        the initial capacity.
+        """
+
+        self._indices = _new_indices(self._min_capacity)
+        self._hashes = array("q")
+        self._keys = []
+        self._values = []
+        self._count = 0
+
+    def find(self, key: Hashable) -> Optional[T]:
+        """
+        Returns the value associated with the given key.
+        """
+
+        index = self._lookup(key, hash(key))[1]
+
+        if index < 0:
+            return None
+
+        return self._values[index]
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Removes the key-value pair associated with the given key.
+        """
+
+        slot, index = self._lookup(key, hash(key))
+
+        if index < 0:
+            raise KeyError(f"'{key}' not found.")
+
+        self._indices[slot] = _DUMMY
+        self._keys[index] = _DELETED
+        self._values[index] = None
+        self._count -= 1
+
+    def _lookup(self, key: Hashable, hash_code: int) -> Tuple[int, int]:
+        """
+        Probes the index array for the given key.
+
+        Returns the slot holding the key and the position of its entry, or,
+        when the key is missing, the slot to insert it into and `-1`.
+        """
+
+        indices = self._indices
+        hashes = self._hashes
+        keys = self._keys
+        mask = len(indices) - 1
+        perturb = hash_code & _PERTURB_MASK
+        slot = perturb & mask
+        free = -1
+
+        while True:
+            index = indices[slot]
+
+            if index == _EMPTY:
+                return (slot if free < 0 else free), -1
+
+            if index == _DUMMY:
+                if free < 0:
+                    free = slot
+            elif hashes[index] == hash_code:
+                stored = keys[index]
+
+                if stored is key or stored == key:
+                    return slot, index
+
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+
+    def _resize(self) -> None:
+        """
+        Drops removed entries from the dense arrays, and rebuilds
+        the index array with room for twice the number of elements.
+        """
+
+        capacity = self._min_capacity
+
+        while capacity * 2 // 3 <= self._count * 2:
+            capacity *= 2
+
+        if self._count < len(self._keys):
+            keys = self._keys
+            live = [i for i, key in enumerate(keys) if key is not _DELETED]
+            self._hashes = array("q", [self._hashes[i] for i in live])
+            self._keys = [keys[i] for i in live]
+            self._values = [self._values[i] for i in live]
+
+        indices = _new_indices(capacity)
+        mask = capacity - 1
+
+        for index, hash_code in enumerate(self._hashes):
+            perturb = hash_code & _PERTURB_MASK
+            slot = perturb & mask
+
+            while indices[slot] != _EMPTY:
+                perturb >>= 5
+                slot = (slot * 5 + perturb + 1) & mask
+
+            indices[slot] = index
+
+        self._indices = indices
@@ -0,0 +1,178 @@
+"""
+Contains a thread-safe hash table that partitions keys across locked shards.
+"""
+
+import threading
+
+from collections.abc import Hashable
+from typing import Callable, Generic, Iterator, List, Optional, TypeVar
+
+from .hash_table import HashTable
+from .protocols import Comparable
+
+
+T = TypeVar("T", bound=Comparable)
+
+_MIX = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+
+
+class ConcurrentHashTable(Generic[T]):
+    """
+    Represents a thread-safe hash table.
+
+    Keys are partitioned across independent `HashTable` shards, each
+    guarded by its own lock, so operations on different shards do not
+    block each other.
+    """
+
+    def __init__(
+        self, shards: int = 16, capacity: int = 32, load_factor: float = 0.75
+    ) -> None:
+        """
+        Initializes the hash table with a given number of shards, each
+        created with the given capacity and load factor.
+        """
+
+        if shards < 1:
+            raise ValueError("Number of shards should be a positive integer.")
+
+        self._shards: List[HashTable[T]] = [
+            HashTable[T](capacity, load_factor) for _ in range(shards)
+        ]
+        # pylint: disable-next=line-too-long
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shards)]
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over all values stored in the hash table.
+        Each shard is copied under its lock before its values are yielded.
+        """
+
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                values = list(shard)
+
+            yield from values
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements stored in the hash table.
+        """
+
+        count = 0
+
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                count += len(shard)
+
+        return count
+
+    @property
+    def shards(self) -> int:
+        """
+        Returns the number of shards of the hash table.
+        """
+
+        return len(self._shards)
+
+    def add(self, key: Hashable, value: T) -> None:
+        """
+        Adds a key-value pair to the hash table.
+        Updates the value if the key already exists.
+        """
+
+        index = self._shard(key)
+
+        with self._locks[index]:
+            self._shards[index].add(key, value)
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the hash table.
+        """
+
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
+
+    def compute(
+        self, key: Hashable, func: Callable[[Optional[T]], Optional[T]]
+    ) -> Optional[T]:
+        """
+        Atomically replaces the value associated with the key by the result
+        of `func`, called with the current value or `None`. The key is
+        removed when `func` returns `None`. Returns the new value.
+        """
+
+        index = self._shard(key)
+        shard = self._shards[index]
+
+        with self._locks[index]:
+            current = shard.find(key)
+            value = func(current)
+
+            if value is not None:
+                shard.add(key, value)
+            elif current is not None:
+                shard.remove(key)
+
+            return value
+
+    def contains(self, key: Hashable) -> bool:
+        """
+        Checks whether a key exists in the hash table.
+        """
+
+        index = self._shard(key)
+
+        with self._locks[index]:
+            return self._shards[index].contains(key)
+
+    def find(self, key: Hashable) -> Optional[T]:
+        """
+        Returns the value associated with the given key.
+        """
+
+        index = self._shard(key)
+
+        with self._locks[index]:
+            return self._shards[index].find(key)
+
+    def get_or_add(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Returns the value associated with the key, atomically adding
+        the result of `factory` first if the key is missing.
+        """
+
+        index = self._shard(key)
+        shard = self._shards[index]
+
+        with self._locks[index]:
+            value = shard.find(key)
+
+            if value is None:
+                value = factory()
+                shard.add(key, value)
+
+            return value
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Removes the key-value pair associated with the given key.
+        """
+
+        index = self._shard(key)
+
+        with self._locks[index]:
+            self._shards[index].remove(key)
+
+    def _shard(self, key: Hashable) -> int:
+        """
+        Computes the shard index for the given key.
+
+        The hash code is mixed first, so the shard index does not correlate
+        with the bucket index the shard derives from the same hash code.
+        """
+
+        return (((hash(key) * _MIX) & _MASK) >> 32) % len(self._shards)
@@ -7,3 +7,11 @@ Contains custom exceptions.
 
 class EmptyCollectionException(Exception):
     pass
+
+
+class FullCollectionException(Exception):
+    pass
+
+
+class ClosedCollectionException(Exception):
+    pass
@@ -2,35 +2,137 @@
 HashTable implementation using separate chaining to resolve collisions.
 """
 
-from typing import List, Generic, Iterator, Tuple, Optional, TypeVar
-
+from collections import Counter
+from collections.abc import Hashable, Mapping, Sized
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .mapped_hash_table import PathType, save_snapshot
 from .protocols import Comparable
 
 
 T = TypeVar("T", bound=Comparable)
 
+# An entry keeps the hash code of its key next to the key and value.
+Entry = Tuple[int, Hashable, T]
+
+
+@dataclass(frozen=True)
+class HashTableStats:
+    """
+    Represents a snapshot of the distribution of keys in a hash table.
+    """
+
+    count: int
+    capacity: int
+    load_factor: float
+    chain_lengths: Dict[int, int]
+    max_chain_length: int
+    mean_chain_length: float
+    resizes: int
+    lookups: int
+    probes: int
+
+    @property
+    def mean_probes(self) -> float:
+        """
+        Returns the average number of entries compared per lookup.
+        """
+
+        return self.probes / self.lookups if self.lookups else 0.0
+
 
 class HashTable(Generic[T]):
     """
     Represents a hash table.
     """
 
-    def __init__(self, capacity: int = 32) -> None:
+    def __init__(
+        self,
+        capacity: int = 32,
+        load_factor: float = 0.75,
+        incremental: bool = False,
+        rehash_step: int = 16,
+    ) -> None:
         """
         Initializes the hash table with a given number of buckets.
+
+        The table doubles its capacity once the number of stored elements
+        exceeds `capacity * load_factor`, and halves it (never below the
+        initial capacity) once it drops under a quarter of that threshold.
+
+        In incremental mode the old and the new buckets coexist after
+        a resize, and every `add` or `remove` migrates a few old buckets,
+        so no single call pays for the whole rehash. A call migrates at
+        least `rehash_step` buckets, and more when needed to finish the
+        rehash before the next resize, so the work of a call stays within
+        a small multiple of `1 / load_factor` buckets.
         """
 
-        self._buckets: List[List[Tuple[str, T]]] = [[] for _ in range(capacity)]
+        if capacity < 1:
+            raise ValueError("Capacity should be a positive integer.")
+
+        if load_factor <= 0:
+            raise ValueError("Load factor should be a positive number.")
+
+        if rehash_step < 1:
+            raise ValueError("Rehash step should be a positive integer.")
+
+        self._buckets: List[Optional[List[Entry[T]]]] = [None] * capacity
+        self._old_buckets: Optional[List[Optional[List[Entry[T]]]]] = None
+        self._rehash_index: int = 0
         self._count: int = 0
+        self._load_factor: float = load_factor
+        self._min_capacity: int = capacity
+        self._incremental: bool = incremental
+        self._rehash_step: int = rehash_step
+        self._grow_at: int = 0
+        self._shrink_at: int = 0
+        self._resizes: int = 0
+        self._lookups: int = 0
+        self._probes: int = 0
+
+        self._update_thresholds()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Checks whether a key exists in the hash table.
+        """
+
+        return self._lookup(key) is not None
+
+    def __getitem__(self, key: Hashable) -> T:
+        """
+        Returns the value associated with the given key,
+        or raises `KeyError` if the key is missing.
+        """
+
+        entry = self._lookup(key)
+
+        if entry is None:
+            raise KeyError(f"'{key}' not found.")
+
+        return entry[2]
 
     def __iter__(self) -> Iterator[T]:
         """
         Iterates over all values stored in the hash table.
         """
 
-        for bucket in self._buckets:
-            for _, value in bucket:
-                yield value
+        for _, _, value in self._entries():
+            yield value
 
     def __len__(self) -> int:
         """
@@ -47,74 +149,608 @@ class HashTable(Generic[T]):
 
         return len(self._buckets)
 
-    def add(self, key: str, value: T) -> None:
+    @property
+    def load_factor(self) -> float:
+        """
+        Returns the maximum ratio of elements to buckets before
+        the hash table grows.
+        """
+
+        return self._load_factor
+
+    @property
+    def rehashing(self) -> bool:
+        """
+        Returns `True` while an incremental rehash is in progress.
+        """
+
+        return self._old_buckets is not None
+
+    def add(self, key: Hashable, value: T) -> None:
         """
         Adds a key-value pair to the hash table.
         Updates the value if the key already exists.
         """
 
-        index = self._hash(key)
-        bucket = self._buckets[index]
+        if self._old_buckets is not None:
+            self._migrate_step()
 
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)
-                return
+        hash_code = hash(key)
+        buckets, index = self._locate(hash_code)
+        bucket = buckets[index]
+
+        if bucket is None:
+            buckets[index] = [(hash_code, key, value)]
+        else:
+            for i, (h, k, _) in enumerate(bucket):
+                if h == hash_code and (k is key or k == key):
+                    bucket[i] = (hash_code, key, value)
+                    return
+
+            bucket.append((hash_code, key, value))
 
-        bucket.append((key, value))
         self._count += 1
 
-    def contains(self, key: str) -> bool:
+        if self._count > self._grow_at:
+            self._resize(len(self._buckets) * 2)
+
+    def add_many(
+        self,
+        items: Union[Mapping[Any, T], Iterable[Tuple[Hashable, T]]],
+    ) -> None:
+        """
+        Adds key-value pairs from a mapping or an iterable of pairs.
+        Updates the values of existing keys.
+
+        When the number of pairs is known up front, the hash table
+        is resized once to fit all of them.
+        """
+
+        pairs = items.items() if isinstance(items, Mapping) else items
+        size = len(pairs) if isinstance(pairs, Sized) else 0
+
+        self._reserve(self._count + size)
+
+        buckets = self._buckets
+        capacity = len(buckets)
+        count = self._count
+
+        for key, value in pairs:
+            hash_code = hash(key)
+            index = hash_code % capacity
+            bucket = buckets[index]
+
+            if bucket is None:
+                buckets[index] = [(hash_code, key, value)]
+            else:
+                replaced = False
+
+                for i, (h, k, _) in enumerate(bucket):
+                    if h == hash_code and (k is key or k == key):
+                        bucket[i] = (hash_code, key, value)
+                        replaced = True
+                        break
+
+                if replaced:
+                    continue
+
+                bucket.append((hash_code, key, value))
+
+            count += 1
+
+            if count > self._grow_at:
+                self._count = count
+                self._reserve(count)
+                buckets = self._buckets
+                capacity = len(buckets)
+
+        self._count = count
+
+    def contains(self, key: Hashable) -> bool:
         """
         Checks whether a key exists in the hash table.
         """
 
-        return bool(self.find(key))
+        return self._lookup(key) is not None
 
     def clear(self) -> None:
         """
-        Removes all the elements from the hash table.
+        Removes all the elements from the hash table, and restores
+        the initial capacity.
         """
 
-        for bucket in self._buckets:
-            bucket.clear()
-
+        self._buckets = [None] * self._min_capacity
+        self._old_buckets = None
+        self._rehash_index = 0
         self._count = 0
 
-    def find(self, key: str) -> Optional[T]:
+        self._update_thresholds()
+
+    def find(self, key: Hashable) -> Optional[T]:
         """
         Returns the value associated with the given key.
         """
 
-        index = self._hash(key)
-        bucket = self._buckets[index]
+        entry = self._lookup(key)
 
-        for k, v in bucket:
-            if k == key:
-                return v
+        return None if entry is None else entry[2]
 
-        return None
+    def find_many(self, keys: Iterable[Hashable]) -> List[Optional[T]]:
+        """
+        Returns the values associated with the given keys, in order,
+        with `None` for missing keys.
+        """
+
+        if self._old_buckets is not None:
+            return [self.find(key) for key in keys]
+
+        buckets = self._buckets
+        capacity = len(buckets)
+        probes = 0
+        result: List[Optional[T]] = []
 
-    def remove(self, key: str) -> None:
+        for key in keys:
+            hash_code = hash(key)
+            bucket = buckets[hash_code % capacity]
+            value = None
+
+            if bucket:
+                for h, k, v in bucket:
+                    probes += 1
+
+                    if h == hash_code and (k is key or k == key):
+                        value = v
+                        break
+
+            result.append(value)
+
+        self._lookups += len(result)
+        self._probes += probes
+
+        return result
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value associated with the given key,
+        or `default` if the key is missing.
+        """
+
+        entry = self._lookup(key)
+
+        return default if entry is None else entry[2]
+
+    def items(self) -> "HashTableItemsView[T]":
+        """
+        Returns a live view of the key-value pairs of the hash table.
+        """
+
+        return HashTableItemsView(self)
+
+    def keys(self) -> "HashTableKeysView[T]":
+        """
+        Returns a live view of the keys of the hash table.
+        """
+
+        return HashTableKeysView(self)
+
+    def remove(self, key: Hashable) -> None:
         """
         Removes the key-value pair associated with the given key.
         """
 
-        index = self._hash(key)
-        bucket = self._buckets[index]
+        if self._old_buckets is not None:
+            self._migrate_step()
+
+        hash_code = hash(key)
+        buckets, index = self._locate(hash_code)
+        bucket = buckets[index] or []
 
-        for i, (k, _) in enumerate(bucket):
-            if k == key:
+        for i, (h, k, _) in enumerate(bucket):
+            if h == hash_code and (k is key or k == key):
                 del bucket[i]
                 self._count -= 1
+
+                if not bucket:
+                    buckets[index] = None
+
+                if self._count < self._shrink_at:
+                    self._resize(len(self._buckets) // 2)
+
                 return
 
         raise KeyError(f"'{key}' not found.")
 
-    def _hash(self, key: str) -> int:
+    def remove_many(self, keys: Iterable[Hashable]) -> List[Optional[T]]:
+        """
+        Removes the key-value pairs associated with the given keys.
+
+        Returns the removed values in order, with `None` for missing keys.
+        The hash table shrinks at most once, after all the removals.
+        While an incremental rehash is pending, every removal migrates
+        a few old buckets, as `remove` does.
+        """
+
+        pending = iter(keys)
+        result: List[Optional[T]] = []
+
+        if self._old_buckets is not None:
+            for key in pending:
+                self._migrate_step()
+
+                hash_code = hash(key)
+                buckets, index = self._locate(hash_code)
+                result.append(self._take(buckets, index, hash_code, key))
+
+                if self._old_buckets is None:
+                    break
+
+        buckets = self._buckets
+        capacity = len(buckets)
+
+        for key in pending:
+            hash_code = hash(key)
+            index = hash_code % capacity
+            result.append(self._take(buckets, index, hash_code, key))
+
+        count = self._count
+
+        if count < self._shrink_at:
+            while capacity > self._min_capacity and count < int(
+                capacity * self._load_factor / 4
+            ):
+                capacity //= 2
+
+            self._resize(capacity)
+
+        return result
+
+    def save(self, path: PathType) -> None:
+        """
+        Writes the key-value pairs to a snapshot file, which can be served
+        without loading it by `MappedHashTable`. Keys should be of type
+        `str`, `bytes` or `int`, and values should be picklable.
+        """
+
+        save_snapshot(path, self.items())
+
+    def values(self) -> "HashTableValuesView[T]":
+        """
+        Returns a live view of the values of the hash table.
+        """
+
+        return HashTableValuesView(self)
+
+    def stats(self) -> HashTableStats:
+        """
+        Returns the load factor, the chain length distribution, and the
+        resize and lookup counters of the hash table.
+
+        The chain length histogram maps a length to the number of buckets
+        with that many entries, and includes the buckets still pending
+        migration during an incremental rehash.
+        """
+
+        buckets = self._buckets
+
+        if self._old_buckets is not None:
+            pending = islice(self._old_buckets, self._rehash_index, None)
+            buckets = list(chain(buckets, pending))
+
+        histogram = Counter(len(bucket) if bucket else 0 for bucket in buckets)
+        used = len(buckets) - histogram[0]
+
+        return HashTableStats(
+            count=self._count,
+            capacity=len(self._buckets),
+            load_factor=self._count / len(self._buckets),
+            chain_lengths=dict(sorted(histogram.items())),
+            max_chain_length=max(histogram),
+            mean_chain_length=self._count / used if used else 0.0,
+            resizes=self._resizes,
+            lookups=self._lookups,
+            probes=self._probes,
+        )
+
+    def _entries(self) -> Iterator[Entry[T]]:
+        """
+        Iterates over all entries, including those in buckets
+        still pending migration during an incremental rehash.
+        """
+
+        if self._old_buckets is not None:
+            old = islice(self._old_buckets, self._rehash_index, None)
+
+            for bucket in filter(None, old):
+                yield from bucket
+
+        for bucket in filter(None, self._buckets):
+            yield from bucket
+
+    # pylint: disable-next=line-too-long
+    def _locate(self, hash_code: int) -> Tuple[List[Optional[List[Entry[T]]]], int]:
+        """
+        Returns the bucket array that holds keys with the given hash code,
+        and the index of their bucket.
+        """
+
+        if self._old_buckets is not None:
+            index = hash_code % len(self._old_buckets)
+
+            if index >= self._rehash_index:
+                return self._old_buckets, index
+
+        return self._buckets, hash_code % len(self._buckets)
+
+    def _lookup(self, key: Hashable) -> Optional[Entry[T]]:
+        """
+        Returns the entry holding the given key, or `None`.
+        """
+
+        hash_code = hash(key)
+        buckets, index = self._locate(hash_code)
+        bucket = buckets[index]
+        self._lookups += 1
+
+        if bucket:
+            probes = 0
+
+            for entry in bucket:
+                probes += 1
+
+                if entry[0] == hash_code:
+                    k = entry[1]
+
+                    if k is key or k == key:
+                        self._probes += probes
+                        return entry
+
+            self._probes += probes
+
+        return None
+
+    def _migrate(self, count: int) -> None:
+        """
+        Moves up to `count` buckets from the old bucket array
+        into the current one.
+        """
+
+        old = self._old_buckets
+
+        if old is None:
+            return
+
+        buckets = self._buckets
+        capacity = len(buckets)
+        start = self._rehash_index
+        end = min(start + count, len(old))
+
+        for i in range(start, end):
+            bucket = old[i]
+
+            if bucket:
+                for entry in bucket:
+                    index = entry[0] % capacity
+                    target = buckets[index]
+
+                    if target is None:
+                        buckets[index] = [entry]
+                    else:
+                        target.append(entry)
+
+                old[i] = None
+
+        self._rehash_index = end
+
+        if end == len(old):
+            self._old_buckets = None
+
+    def _migrate_step(self) -> None:
+        """
+        Moves the old buckets for one operation during an incremental
+        rehash: at least `rehash_step` of them, and enough that the old
+        bucket array is empty before the element count can reach the next
+        resize threshold, so a resize never has a rehash to finish.
+        """
+
+        old = self._old_buckets
+
+        if old is None:
+            return
+
+        left = self._grow_at - self._count
+
+        if self._shrink_at:
+            left = min(left, self._count - self._shrink_at)
+
+        remaining = len(old) - self._rehash_index
+        self._migrate(max(self._rehash_step, -(-remaining // max(left, 1))))
+
+    def _resize(self, capacity: int) -> None:
+        """
+        Redistributes all the elements across a new number of buckets,
+        either at once or, in incremental mode, over the next operations.
+        """
+
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+
+        self._old_buckets = self._buckets
+        self._rehash_index = 0
+        self._buckets = [None] * max(capacity, self._min_capacity)
+        self._resizes += 1
+
+        self._update_thresholds()
+
+        if not self._incremental:
+            self._migrate(len(self._old_buckets))
+
+    def _reserve(self, count: int) -> None:
+        """
+        Resizes the hash table at once, so it can hold `count` elements
+        without growing, and completes any pending incremental rehash.
+        """
+
+        capacity = len(self._buckets)
+
+        while count > int(capacity * self._load_factor):
+            capacity *= 2
+
+        if capacity != len(self._buckets):
+            self._resize(capacity)
+
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+
+    def _take(
+        self,
+        buckets: List[Optional[List[Entry[T]]]],
+        index: int,
+        hash_code: int,
+        key: Hashable,
+    ) -> Optional[T]:
+        """
+        Removes the entry with the given key from a bucket, and returns
+        its value, or `None` if the bucket does not hold the key.
+        """
+
+        bucket = buckets[index]
+
+        if bucket:
+            for i, (h, k, v) in enumerate(bucket):
+                if h == hash_code and (k is key or k == key):
+                    del bucket[i]
+                    self._count -= 1
+
+                    if not bucket:
+                        buckets[index] = None
+
+                    return v
+
+        return None
+
+    def _update_thresholds(self) -> None:
+        """
+        Recomputes the element counts that trigger growing or shrinking.
+        """
+
+        capacity = len(self._buckets)
+
+        self._grow_at = int(capacity * self._load_factor)
+
+        if capacity > self._min_capacity:
+            self._shrink_at = int(capacity * self._load_factor / 4)
+        else:
+            self._shrink_at = 0
+
+
+class HashTableKeysView(Generic[T]):
+    """
+    Represents a live view of the keys of a hash table.
+    """
+
+    def __init__(self, table: HashTable[T]) -> None:
+        """
+        Initializes a view over the given hash table.
+        """
+
+        self._table = table
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Checks whether a key exists in the hash table.
+        """
+
+        return key in self._table
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """
+        Iterates over all keys stored in the hash table.
+        """
+
+        # pylint: disable-next=protected-access
+        for _, key, _ in self._table._entries():
+            yield key
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys in the hash table.
+        """
+
+        return len(self._table)
+
+
+class HashTableValuesView(Generic[T]):
+    """
+    Represents a live view of the values of a hash table.
+    """
+
+    def __init__(self, table: HashTable[T]) -> None:
+        """
+        Initializes a view over the given hash table.
+        """
+
+        self._table = table
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Checks whether a value is stored in the hash table.
+        """
+
+        return any(v is value or v == value for v in self._table)
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over all values stored in the hash table.
+        """
+
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values in the hash table.
+        """
+
+        return len(self._table)
+
+
+class HashTableItemsView(Generic[T]):
+    """
+    Represents a live view of the key-value pairs of a hash table.
+    """
+
+    def __init__(self, table: HashTable[T]) -> None:
+        """
+        Initializes a view over the given hash table.
+        """
+
+        self._table = table
+
+    def __contains__(self, item: object) -> bool:
+        """
+        Checks whether a key-value pair is stored in the hash table.
+        """
+
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+
+        key, value = item
+        # pylint: disable-next=protected-access
+        entry = self._table._lookup(key)
+
+        return entry is not None and (entry[2] is value or entry[2] == value)
+
+    def __iter__(self) -> Iterator[Tuple[Hashable, T]]:
+        """
+        Iterates over all key-value pairs stored in the hash table.
+        """
+
+        # pylint: disable-next=protected-access
+        for _, key, value in self._table._entries():
+            yield key, value
+
+    def __len__(self) -> int:
         """
-        Computes a hash index for the given key.
+        Returns the number of key-value pairs in the hash table.
         """
 
-        hash_sum = sum(ord(char) for char in key)
-        return hash_sum % len(self._buckets)
+        return len(self._table)
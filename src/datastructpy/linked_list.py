@@ -265,6 +265,23 @@ class LinkedList(Generic[T]):
 
         return None
 
+    def move_to_last(self, node: LinkedListNode[T]) -> None:
+        """
+        Moves a node of this list to the end of the list.
+        """
+
+        self._validate_node(node)
+
+        if self._head and self._head._prev == node:
+            return
+
+        self._remove_node(node)
+
+        if not self._head:
+            self._add_to_empty_list(node)
+        else:
+            self._add_node_before(self._head, node)
+
     def remove(self, value: T) -> None:
         """
         Removes the first node with the specified value from the list.
@@ -275,6 +292,16 @@ class LinkedList(Generic[T]):
                 self._remove_node(node)
                 break
 
+    def remove_node(self, node: LinkedListNode[T]) -> None:
+        """
+        Removes the specified node from the list.
+        """
+
+        self._validate_node(node)
+        self._remove_node(node)
+
+        node._list = None
+
     def remove_first(self) -> None:
         """
         Removes the first node from the list.
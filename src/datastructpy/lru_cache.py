@@ -0,0 +1,300 @@
+"""
+Contains a least-recently-used cache with optional per-entry expiry.
+"""
+
+import time
+
+from collections.abc import Hashable
+from functools import wraps
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from .hash_table import HashTable
+from .linked_list import LinkedList, LinkedListNode
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_MISSING = object()
+
+# Separates the positional from the keyword arguments in memoize keys.
+_KWARGS = object()
+
+
+class _CacheEntry(Generic[T]):
+    """
+    Represents a cached value with its weight and expiration time.
+    """
+
+    __slots__ = ("key", "value", "weight", "expires_at")
+
+    def __init__(
+        self,
+        key: Hashable,
+        value: T,
+        weight: int,
+        expires_at: Optional[float],
+    ) -> None:
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires_at = expires_at
+
+
+class LRUCache(Generic[T]):
+    """
+    Represents a least-recently-used cache.
+
+    Entries are evicted in least-recently-used order once the cache holds
+    more than `max_size` entries, or once the total weight of the entries
+    exceeds `max_weight`. Expired entries are dropped lazily, when they
+    are accessed.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[T], int]] = None,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a new cache.
+
+        `weigher` computes the weight of a value, and defaults to 1 per
+        entry. `ttl` is the default time to live of an entry in seconds
+        of `clock`.
+        """
+
+        if max_size is not None and max_size < 1:
+            raise ValueError("Max size should be a positive integer.")
+
+        if max_weight is not None and max_weight < 1:
+            raise ValueError("Max weight should be a positive integer.")
+
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL should be a positive number.")
+
+        self._table: HashTable[Any] = HashTable()
+        self._list: LinkedList[Any] = LinkedList()
+        self._max_size: Optional[int] = max_size
+        self._max_weight: Optional[int] = max_weight
+        self._weigher: Optional[Callable[[T], int]] = weigher
+        self._ttl: Optional[float] = ttl
+        self._clock: Callable[[], float] = clock
+        self._weight: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries in the cache, including expired
+        entries that were not accessed yet.
+        """
+
+        return len(self._table)
+
+    @property
+    def weight(self) -> int:
+        """
+        Returns the total weight of the entries in the cache.
+        """
+
+        return self._weight
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of lookups that found a live entry.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of lookups that found no live entry.
+        """
+
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """
+        Returns the number of entries evicted to respect the size
+        or weight limits.
+        """
+
+        return self._evictions
+
+    def clear(self) -> None:
+        """
+        Removes all the entries from the cache. The counters are kept.
+        """
+
+        self._table.clear()
+        self._list.clear()
+        self._weight = 0
+
+    def contains(self, key: Hashable) -> bool:
+        """
+        Returns `True` if the cache holds a live entry for the key,
+        without marking it as recently used.
+        """
+
+        node = self._table.find(key)
+
+        if node is None:
+            return False
+
+        if self._expired(node.value):
+            self._unlink(node)
+            return False
+
+        return True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value cached for the key and marks it as recently
+        used, or returns `default` if there is no live entry.
+        """
+
+        node = self._table.find(key)
+
+        if node is None:
+            self._misses += 1
+            return default
+
+        entry = node.value
+
+        if self._expired(entry):
+            self._unlink(node)
+            self._misses += 1
+            return default
+
+        self._list.move_to_last(node)
+        self._hits += 1
+
+        return entry.value
+
+    def put(self, key: Hashable, value: T, ttl: Optional[float] = None) -> None:
+        """
+        Caches a value for the key, replacing any existing entry, and
+        evicts least-recently-used entries if a limit is exceeded.
+        `ttl` overrides the default time to live of the cache.
+
+        A value heavier than `max_weight` is not cached.
+        """
+
+        weight = self._weigher(value) if self._weigher else 1
+        ttl = self._ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self._clock() + ttl
+        node = self._table.find(key)
+
+        if self._max_weight is not None and weight > self._max_weight:
+            if node is not None:
+                self._unlink(node)
+
+            return
+
+        if node is not None:
+            entry = node.value
+            self._weight += weight - entry.weight
+            entry.value = value
+            entry.weight = weight
+            entry.expires_at = expires_at
+            self._list.move_to_last(node)
+        else:
+            entry = _CacheEntry(key, value, weight, expires_at)
+            self._table.add(key, self._list.add_last(entry))
+            self._weight += weight
+
+        self._evict()
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Removes the entry associated with the given key.
+        """
+
+        node = self._table.find(key)
+
+        if node is None:
+            raise KeyError(f"'{key}' not found.")
+
+        self._unlink(node)
+
+    def _evict(self) -> None:
+        """
+        Removes least-recently-used entries until the limits are met.
+        """
+
+        max_size = self._max_size
+        max_weight = self._max_weight
+
+        while self._list.first is not None and (
+            (max_size is not None and len(self._table) > max_size)
+            or (max_weight is not None and self._weight > max_weight)
+        ):
+            self._unlink(self._list.first)
+            self._evictions += 1
+
+    def _expired(self, entry: _CacheEntry[T]) -> bool:
+        """
+        Checks whether the entry has expired.
+        """
+
+        expires_at = entry.expires_at
+
+        return expires_at is not None and expires_at <= self._clock()
+
+    def _unlink(self, node: LinkedListNode[Any]) -> None:
+        """
+        Removes the node of an entry from both the list and the table.
+        """
+
+        entry = node.value
+        self._table.remove(entry.key)
+        self._list.remove_node(node)
+        self._weight -= entry.weight
+
+
+# pylint: disable-next=too-many-arguments
+def memoize(
+    max_size: Optional[int] = 128,
+    max_weight: Optional[int] = None,
+    weigher: Optional[Callable[[Any], int]] = None,
+    ttl: Optional[float] = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """
+    Returns a decorator that caches the results of a function in an
+    `LRUCache`, keyed by its arguments. The cache is exposed as the
+    `cache` attribute of the decorated function.
+    """
+
+    def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        cache = LRUCache[R](max_size, max_weight, weigher, ttl, clock)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> R:
+            key = args
+
+            if kwargs:
+                key += (_KWARGS, frozenset(kwargs.items()))
+
+            result = cache.get(key, _MISSING)
+
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+
+            return result  # type: ignore[no-any-return]
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,262 @@
+"""
+Contains a read-only hash table served from a memory-mapped snapshot file.
+
+A snapshot starts with a header holding a magic number, the number of
+entries and the number of slots. It is followed by a slot table, where each
+slot holds a key hash and the file offset of an entry, and by the entries,
+each holding the lengths of its encoded key and pickled value followed by
+their bytes. Collisions are resolved by linear probing over the slots.
+"""
+
+import mmap
+import os
+import pickle
+import stat
+import struct
+import tempfile
+
+from collections.abc import Hashable
+from hashlib import blake2b
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+_MAGIC = b"DSPYHT01"
+_HEADER = struct.Struct("<8sQQ")
+_SLOT = struct.Struct("<QQ")
+_ENTRY = struct.Struct("<II")
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+def _encode_key(key: Hashable) -> bytes:
+    """
+    Encodes a key into bytes that compare equal whenever the keys do.
+    Only `str`, `bytes` and `int` keys are supported.
+    """
+
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8")
+
+    if isinstance(key, bytes):
+        return b"b" + key
+
+    if isinstance(key, int):
+        return b"i" + str(int(key)).encode("ascii")
+
+    raise TypeError(f"Unsupported snapshot key type: {type(key).__name__}.")
+
+
+def _hash_key(encoded: bytes) -> int:
+    """
+    Computes a hash of an encoded key that is stable across processes.
+    """
+
+    return int.from_bytes(blake2b(encoded, digest_size=8).digest(), "little")
+
+
+def _file_mode(path: PathType) -> int:
+    """
+    Returns the permission bits of an existing file, or those a new file
+    gets from the process umask.
+    """
+
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+
+        return 0o666 & ~umask
+
+
+# pylint: disable-next=line-too-long
+def save_snapshot(path: PathType, items: Iterable[Tuple[Hashable, Any]]) -> None:
+    """
+    Writes key-value pairs to a snapshot file that can be opened
+    with `MappedHashTable`.
+
+    The file is written to a temporary file next to the target and moved
+    into place, so readers never observe a partially written snapshot.
+    The temporary file is removed if writing fails. The snapshot keeps
+    the permissions of the file it replaces, or gets those of a newly
+    created file.
+    """
+
+    entries: List[Tuple[int, bytes, bytes]] = []
+
+    for key, value in items:
+        encoded = _encode_key(key)
+        pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        entries.append((_hash_key(encoded), encoded, pickled))
+
+    slots = 8
+
+    while slots < len(entries) * 2:
+        slots *= 2
+
+    table: List[Tuple[int, int]] = [(0, 0)] * slots
+    offset = _HEADER.size + slots * _SLOT.size
+    mask = slots - 1
+
+    for hash_code, encoded, pickled in entries:
+        slot = hash_code & mask
+
+        while table[slot][1]:
+            slot = (slot + 1) & mask
+
+        table[slot] = (hash_code, offset)
+        offset += _ENTRY.size + len(encoded) + len(pickled)
+
+    directory, name = os.path.split(os.path.abspath(path))
+    descriptor, temp = tempfile.mkstemp(".tmp", f"{name}.", directory)
+
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            os.chmod(temp, _file_mode(path))
+            file.write(_HEADER.pack(_MAGIC, len(entries), slots))
+
+            for hash_code, entry_offset in table:
+                file.write(_SLOT.pack(hash_code, entry_offset))
+
+            for _, encoded, pickled in entries:
+                file.write(_ENTRY.pack(len(encoded), len(pickled)))
+                file.write(encoded)
+                file.write(pickled)
+
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+class MappedHashTable:
+    """
+    Represents a read-only hash table backed by a memory-mapped snapshot.
+
+    Lookups read the slot table and the matching entry straight from the
+    mapped file, so opening a snapshot does not materialize its entries,
+    and processes mapping the same file share it through the page cache.
+    """
+
+    def __init__(self, path: PathType) -> None:
+        """
+        Opens and maps a snapshot written by `HashTable.save`.
+        """
+
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"'{os.fspath(path)}' is not a snapshot file.")
+
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, slots = _HEADER.unpack_from(self._buffer, 0)
+
+        if magic != _MAGIC:
+            self._buffer.close()
+            raise ValueError(f"'{os.fspath(path)}' is not a snapshot file.")
+
+        self._count: int = count
+        self._slots: int = slots
+
+    def __enter__(self) -> "MappedHashTable":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over all values stored in the snapshot.
+        """
+
+        for offset in self._offsets():
+            yield self._value(offset)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries stored in the snapshot.
+        """
+
+        return self._count
+
+    def close(self) -> None:
+        """
+        Unmaps the snapshot file.
+        """
+
+        self._buffer.close()
+
+    def contains(self, key: Hashable) -> bool:
+        """
+        Checks whether a key exists in the snapshot.
+        """
+
+        return self._lookup(key) >= 0
+
+    def find(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value associated with the given key.
+        """
+
+        offset = self._lookup(key)
+
+        if offset < 0:
+            return None
+
+        return self._value(offset)
+
+    def _lookup(self, key: Hashable) -> int:
+        """
+        Returns the offset of the entry holding the key, or `-1`.
+        """
+
+        try:
+            encoded = _encode_key(key)
+        except TypeError:
+            return -1
+
+        hash_code = _hash_key(encoded)
+        buffer = self._buffer
+        mask = self._slots - 1
+        slot = hash_code & mask
+
+        stored: int
+        offset: int
+
+        while True:
+            position = _HEADER.size + slot * _SLOT.size
+            stored, offset = _SLOT.unpack_from(buffer, position)
+
+            if not offset:
+                return -1
+
+            if stored == hash_code:
+                key_length, _ = _ENTRY.unpack_from(buffer, offset)
+                start = offset + _ENTRY.size
+
+                if buffer[start : start + key_length] == encoded:
+                    return offset
+
+            slot = (slot + 1) & mask
+
+    def _offsets(self) -> Iterator[int]:
+        """
+        Iterates over the entry offsets of occupied slots.
+        """
+
+        end = _HEADER.size + self._slots * _SLOT.size
+
+        with memoryview(self._buffer) as view:
+            for _, offset in _SLOT.iter_unpack(view[_HEADER.size : end]):
+                if offset:
+                    yield offset
+
+    def _value(self, offset: int) -> Any:
+        """
+        Unpickles the value of the entry at the given offset.
+        """
+
+        key_length, value_length = _ENTRY.unpack_from(self._buffer, offset)
+        start = offset + _ENTRY.size + key_length
+
+        return pickle.loads(self._buffer[start : start + value_length])
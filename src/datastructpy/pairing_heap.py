@@ -0,0 +1,410 @@
+"""
+Contains a mergeable priority queue based on a pairing heap.
+"""
+
+# pylint: disable=protected-access
+
+from operator import lt as default_lt
+from typing import Callable, Generic, List, Optional, TypeVar, final
+
+from .base_comparer import BaseComparer, DefaultComparer
+from .exceptions import EmptyCollectionException
+from .protocols import Comparable
+
+
+P = TypeVar("P", bound=Comparable)
+T = TypeVar("T", bound=Comparable)
+
+
+@final
+class _Membership(Generic[P, T]):
+    """
+    Represents the heap a group of nodes belongs to.
+
+    Every node points to a membership instead of its heap. Melding two
+    heaps links the membership of one heap to the membership of the other,
+    so all the nodes of a heap move in constant time, and the heap of
+    a node is found by following the links as in a disjoint-set forest.
+    """
+
+    __slots__ = ("heap", "parent")
+
+    def __init__(self, heap: Optional["PairingHeap[P, T]"]) -> None:
+        self.heap: Optional["PairingHeap[P, T]"] = heap
+        self.parent: Optional[_Membership[P, T]] = None
+
+    def find(self) -> "_Membership[P, T]":
+        """
+        Returns the root membership, compressing the path to it.
+        """
+
+        root = self
+
+        while root.parent is not None:
+            root = root.parent
+
+        member = self
+
+        while member.parent is not None and member.parent is not root:
+            member.parent, member = root, member.parent
+
+        return root
+
+
+@final
+class PairingHeapNode(Generic[P, T]):
+    """
+    Represents an element of a pairing heap.
+    """
+
+    __slots__ = (
+        "_priority",
+        "_child",
+        "_sibling",
+        "_prev",
+        "_member",
+        "value",
+    )
+
+    # pylint: disable-next=line-too-long
+    def __init__(self, priority: P, value: T, member: _Membership[P, T]) -> None:
+        """
+        Initializes a new node belonging to the given membership.
+        """
+
+        self._priority: P = priority
+        self._child: Optional[PairingHeapNode[P, T]] = None
+        self._sibling: Optional[PairingHeapNode[P, T]] = None
+        self._prev: Optional[PairingHeapNode[P, T]] = None
+        self._member: Optional[_Membership[P, T]] = member
+
+        self.value: T = value
+
+    @property
+    def priority(self) -> P:
+        """
+        Returns the priority of the element.
+        """
+
+        return self._priority
+
+    @property
+    def heap(self) -> Optional["PairingHeap[P, T]"]:
+        """
+        Returns the heap the element belongs to, or `None`
+        if it was removed.
+        """
+
+        return self._member.find().heap if self._member else None
+
+
+class PairingHeap(Generic[P, T]):
+    """
+    Represents a min-heap-based priority queue that can be melded with
+    another one in constant time.
+
+    `enqueue`, `peek` and `meld` take constant time, and `dequeue` takes
+    amortized logarithmic time. `enqueue` returns a handle, which can be
+    used to decrease the priority of the element in constant time, or
+    to remove it in amortized logarithmic time.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new heap.
+        """
+
+        self._comparer: Optional[BaseComparer[P]] = None
+        self._lt: Callable[[P, P], bool] = default_lt
+        self._root: Optional[PairingHeapNode[P, T]] = None
+        self._size: int = 0
+        self._member: _Membership[P, T] = _Membership(self)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the heap.
+        """
+
+        return self._size
+
+    @property
+    def comparer(self) -> BaseComparer[P]:
+        """
+        Returns the comparer used to evaluate equality of values.
+        """
+
+        if not self._comparer:
+            self._comparer = DefaultComparer[P]()
+
+        return self._comparer
+
+    @comparer.setter
+    def comparer(self, comparer: object) -> None:
+        """
+        Sets the custom comparer, and restores the heap order
+        of the elements already in the heap.
+        """
+
+        if not isinstance(comparer, BaseComparer):
+            raise ValueError("Comparer should be an instance of BaseComparer.")
+
+        self._comparer = comparer
+        self._lt = comparer.lt
+
+        if self._root is None:
+            return
+
+        nodes: List[PairingHeapNode[P, T]] = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+
+            if node._child:
+                stack.append(node._child)
+
+            if node._sibling:
+                stack.append(node._sibling)
+
+        for node in nodes:
+            node._child = node._sibling = node._prev = None
+
+        self._root = self._merge_pairs(nodes)
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the heap.
+        """
+
+        self._member.heap = None
+        self._root = None
+        self._size = 0
+        self._member = _Membership(self)
+
+    def contains(self, handle: PairingHeapNode[P, T]) -> bool:
+        """
+        Returns `True` if the handle refers to an element of this heap.
+        """
+
+        return handle.heap is self
+
+    # pylint: disable-next=line-too-long
+    def decrease_priority(self, handle: PairingHeapNode[P, T], priority: P) -> None:
+        """
+        Lowers the priority of the element referred to by the handle
+        in constant time. Raises `ValueError` if the new priority is
+        greater than the current one.
+        """
+
+        self._validate_handle(handle)
+
+        if self._lt(handle._priority, priority):
+            raise ValueError("The new priority is greater than the old one.")
+
+        handle._priority = priority
+
+        if handle is not self._root:
+            self._cut(handle)
+            self._root = self._link(self._root, handle)
+
+    def dequeue(self) -> T:
+        """
+        Removes and returns the object at the beginning of the heap.
+        """
+
+        root = self._root
+
+        if root is None:
+            raise EmptyCollectionException("The queue is empty!")
+
+        self._root = self._merge_children(root)
+        self._size -= 1
+        root._member = None
+
+        return root.value
+
+    def enqueue(self, priority: P, value: T) -> PairingHeapNode[P, T]:
+        """
+        Adds an object to the heap, and returns its handle.
+        """
+
+        node = PairingHeapNode(priority, value, self._member)
+        self._root = self._link(self._root, node)
+        self._size += 1
+
+        return node
+
+    def meld(self, other: "PairingHeap[P, T]") -> None:
+        """
+        Moves all the elements of another heap into this one, leaving the
+        other heap empty. Handles to the moved elements stay valid.
+
+        Both heaps should order priorities with the same type of comparer.
+        """
+
+        if other is self:
+            raise ValueError("A heap cannot be melded with itself.")
+
+        if type(other.comparer) is not type(self.comparer):
+            raise ValueError("The heaps should use the same type of comparer.")
+
+        if other._root is None:
+            return
+
+        self._root = self._link(self._root, other._root)
+        self._size += other._size
+        other._member.heap = None
+        other._member.parent = self._member
+        other._root = None
+        other._size = 0
+        other._member = _Membership(other)
+
+    def peek(self) -> T:
+        """
+        Returns the object at the beginning of the heap without removing it.
+        """
+
+        if self._root is None:
+            raise EmptyCollectionException("The queue is empty!")
+
+        return self._root.value
+
+    def remove(self, handle: PairingHeapNode[P, T]) -> T:
+        """
+        Removes the element referred to by the handle, and returns its value.
+        """
+
+        self._validate_handle(handle)
+
+        if handle is self._root:
+            return self.dequeue()
+
+        self._cut(handle)
+        self._root = self._link(self._root, self._merge_children(handle))
+        self._size -= 1
+        handle._member = None
+
+        return handle.value
+
+    # pylint: disable-next=line-too-long
+    def update_priority(self, handle: PairingHeapNode[P, T], priority: P) -> None:
+        """
+        Changes the priority of the element referred to by the handle.
+        """
+
+        self._validate_handle(handle)
+
+        if not self._lt(handle._priority, priority):
+            self.decrease_priority(handle, priority)
+            return
+
+        # An increased priority may break the order with the children,
+        # so the node is detached from them and linked back on its own.
+        if handle is self._root:
+            self._root = self._merge_children(handle)
+        else:
+            self._cut(handle)
+            self._root = self._link(self._root, self._merge_children(handle))
+
+        handle._priority = priority
+        self._root = self._link(self._root, handle)
+
+    @staticmethod
+    def _cut(node: PairingHeapNode[P, T]) -> None:
+        """
+        Detaches a non-root node and its subtree from its parent.
+        """
+
+        prev = node._prev
+        sibling = node._sibling
+
+        if prev is not None:
+            if prev._child is node:
+                prev._child = sibling
+            else:
+                prev._sibling = sibling
+
+        if sibling is not None:
+            sibling._prev = prev
+
+        node._prev = node._sibling = None
+
+    def _link(
+        self,
+        first: Optional[PairingHeapNode[P, T]],
+        second: Optional[PairingHeapNode[P, T]],
+    ) -> Optional[PairingHeapNode[P, T]]:
+        """
+        Links two root nodes, making the one with the greater priority
+        the first child of the other, and returns the new root.
+        """
+
+        if first is None:
+            return second
+
+        if second is None:
+            return first
+
+        if self._lt(second._priority, first._priority):
+            first, second = second, first
+
+        child = first._child
+        second._sibling = child
+        second._prev = first
+
+        if child is not None:
+            child._prev = second
+
+        first._child = second
+
+        return first
+
+    def _merge_children(
+        self, node: PairingHeapNode[P, T]
+    ) -> Optional[PairingHeapNode[P, T]]:
+        """
+        Detaches the children of a node, and merges them into one tree.
+        """
+
+        children: List[PairingHeapNode[P, T]] = []
+        child = node._child
+        node._child = None
+
+        while child is not None:
+            sibling = child._sibling
+            child._prev = child._sibling = None
+            children.append(child)
+            child = sibling
+
+        return self._merge_pairs(children)
+
+    def _merge_pairs(
+        self, nodes: List[PairingHeapNode[P, T]]
+    ) -> Optional[PairingHeapNode[P, T]]:
+        """
+        Merges detached trees with the two-pass pairing strategy: links
+        them in pairs from left to right, then links the pairs from right
+        to left.
+        """
+
+        link = self._link
+        count = len(nodes)
+        pairs = [
+            link(nodes[index], nodes[index + 1] if index + 1 < count else None)
+            for index in range(0, count, 2)
+        ]
+        root: Optional[PairingHeapNode[P, T]] = None
+
+        for pair in reversed(pairs):
+            root = link(pair, root)
+
+        return root
+
+    def _validate_handle(self, handle: PairingHeapNode[P, T]) -> None:
+        """
+        Validates that the handle refers to an element of this heap.
+        """
+
+        if handle.heap is not self:
+            raise ValueError("The handle does not belong to this heap.")
@@ -2,7 +2,19 @@
 Contains a min-heap-based priority queue.
 """
 
-from typing import Generic, List, Optional, Tuple, TypeVar
+from heapq import heapify, heappop, heappush, heapreplace
+from itertools import count as counter
+from operator import lt as default_lt
+from typing import (
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from .base_comparer import BaseComparer, DefaultComparer
 from .exceptions import EmptyCollectionException
@@ -10,29 +22,79 @@ from .protocols import Comparable
 
 
 P = TypeVar("P", bound=Comparable)
-T = TypeVar("T", bound=Comparable)
+T = TypeVar("T")
+
+# An entry is a `(priority, sequence, value)` triple. The unique sequence
+# number breaks ties between equal priorities, so values are never compared.
+Entry = Tuple[P, int, T]
 
 
 class PriorityQueue(Generic[P, T]):
     """
     Represents a min-heap-based priority queue.
+
+    The heap is a d-ary heap with the given arity, and a binary heap with
+    the default comparer is maintained by `heapq`. Every element is tagged
+    with an insertion sequence number, so values are never compared, and
+    elements with equal priorities are dequeued in insertion order.
+
+    In bounded mode the queue keeps at most `capacity` elements, those
+    that would be dequeued last. Once it is full, a new element is compared
+    with the first one, and either replaces it or is dropped, which keeps
+    the k greatest elements of a stream in O(k) memory.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        items: Optional[Iterable[Tuple[P, T]]] = None,
+        arity: int = 2,
+        capacity: Optional[int] = None,
+    ) -> None:
         """
-        Initializes a new priority queue.
+        Initializes a new priority queue from optional priority-value pairs.
+        The initial heap is built bottom-up in linear time.
         """
 
+        if arity < 2:
+            raise ValueError("Arity should be an integer greater than 1.")
+
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity should be a positive integer.")
+
         self._comparer: Optional[BaseComparer[P]] = None
-        self._heap: List[Tuple[P, T]] = []
-        self._count: int = 0
+        self._lt: Callable[[Entry[P, T], Entry[P, T]], bool] = default_lt
+        self._arity: int = arity
+        self._sequence: Iterator[int] = counter()
+        self._capacity: Optional[int] = capacity
+        self._heapq: bool = arity == 2
+        self._heap: List[Entry[P, T]] = []
+
+        if items is not None:
+            self.enqueue_many(items)
 
     def __len__(self) -> int:
         """
         Returns the number of elements in the queue.
         """
 
-        return self._count
+        return len(self._heap)
+
+    @property
+    def arity(self) -> int:
+        """
+        Returns the maximum number of children of a heap node.
+        """
+
+        return self._arity
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """
+        Returns the maximum number of elements kept in the queue,
+        or `None` if the queue is unbounded.
+        """
+
+        return self._capacity
 
     @property
     def comparer(self) -> BaseComparer[P]:
@@ -48,13 +110,20 @@ class PriorityQueue(Generic[P, T]):
     @comparer.setter
     def comparer(self, comparer: object) -> None:
         """
-        Sets the custom comparer.
+        Sets the custom comparer, and restores the heap order
+        of the elements already in the queue.
         """
 
         if not isinstance(comparer, BaseComparer):
             raise ValueError("Comparer should be an instance of BaseComparer.")
 
+        # pylint: disable-next=unidiomatic-typecheck
+        default = type(comparer) is DefaultComparer
+
         self._comparer = comparer
+        self._lt = default_lt if default else self._entry_lt(comparer)
+        self._heapq = default and self._arity == 2
+        self._heapify()
 
     @property
     def id(self) -> int:
@@ -70,31 +139,99 @@ class PriorityQueue(Generic[P, T]):
         """
 
         self._heap = []
-        self._count = 0
 
     def dequeue(self) -> T:
         """
         Removes and returns the object at the beginning of the queue.
         """
 
-        if not self._heap:
+        heap = self._heap
+
+        if not heap:
             raise EmptyCollectionException("The queue is empty!")
 
-        self._swap(0, len(self._heap) - 1)
-        _, value = self._heap.pop()
-        self._heapify_down()
-        self._count -= 1
+        if self._heapq:
+            return heappop(heap)[2]
+
+        return self._pop()[2]
+
+    def dequeue_many(self, count: int) -> List[T]:
+        """
+        Removes and returns up to `count` objects from the beginning
+        of the queue, in priority order.
+        """
+
+        if count < 0:
+            raise ValueError("Count should be a non-negative integer.")
+
+        heap = self._heap
+        count = min(count, len(heap))
 
-        return value
+        if self._heapq:
+            return [heappop(heap)[2] for _ in range(count)]
+
+        return [self._pop()[2] for _ in range(count)]
+
+    def drain(self) -> Iterator[T]:
+        """
+        Removes and yields objects from the beginning of the queue,
+        in priority order, until the queue is empty.
+        """
+
+        heap = self._heap
+
+        while heap:
+            yield heappop(heap)[2] if self._heapq else self._pop()[2]
 
     def enqueue(self, priority: P, value: T) -> None:
         """
         Adds an object to the end of the queue.
+        In bounded mode, a full queue either replaces its first object
+        or drops the new one.
+        """
+
+        entry: Entry[P, T] = (priority, next(self._sequence), value)
+        heap = self._heap
+
+        if self._capacity is not None and len(heap) >= self._capacity:
+            self._replace_first([entry])
+        elif self._heapq:
+            heappush(heap, entry)
+        else:
+            heap.append(entry)
+            self._sift_up(len(heap) - 1)
+
+    def enqueue_many(self, items: Iterable[Tuple[P, T]]) -> None:
         """
+        Adds priority-value pairs to the queue.
 
-        self._heap.append((priority, value))
-        self._heapify_up(len(self._heap) - 1)
-        self._count += 1
+        When the batch is larger than the queue, the heap is rebuilt
+        bottom-up instead of sifting each element up. In bounded mode,
+        the pairs that do not fit are streamed through `_replace_first`.
+        """
+
+        entries = self._entries(items)
+        heap = self._heap
+
+        if self._capacity is not None:
+            free = max(self._capacity - len(heap), 0)
+            entries, rest = entries[:free], entries[free:]
+        else:
+            rest = []
+
+        if len(entries) > len(heap):
+            heap.extend(entries)
+            self._heapify()
+        elif self._heapq:
+            for entry in entries:
+                heappush(heap, entry)
+        else:
+            for entry in entries:
+                heap.append(entry)
+                self._sift_up(len(heap) - 1)
+
+        if rest:
+            self._replace_first(rest)
 
     def peek(self) -> T:
         """
@@ -104,44 +241,134 @@ class PriorityQueue(Generic[P, T]):
         if not self._heap:
             raise EmptyCollectionException("The queue is empty!")
 
-        return self._heap[0][1]
+        return self._heap[0][2]
 
-    def _heapify_up(self, index: int) -> None:
+    def _entries(self, items: Iterable[Tuple[P, T]]) -> List[Entry[P, T]]:
         """
-        Moves the element at the given index up.
+        Creates heap entries from priority-value pairs.
         """
 
-        parent = (index - 1) // 2
+        sequence = self._sequence
 
-        # pylint: disable-next=line-too-long
-        if index > 0 and self.comparer.lt(self._heap[index][0], self._heap[parent][0]):
-            self._swap(index, parent)
-            self._heapify_up(parent)
+        return [(p, next(sequence), value) for p, value in items]
 
-    def _heapify_down(self, index: int = 0) -> None:
+    def _entry_lt(
+        self, comparer: BaseComparer[P]
+    ) -> Callable[[Entry[P, T], Entry[P, T]], bool]:
         """
-        Moves the element at the given index down.
+        Creates a function that orders entries by their priorities using
+        the given comparer, breaking ties by sequence number.
         """
 
-        child = 2 * index + 1
+        lt = comparer.lt
+
+        def entry_lt(entry1: Entry[P, T], entry2: Entry[P, T]) -> bool:
+            if lt(entry1[0], entry2[0]):
+                return True
 
-        if child >= len(self._heap):
+            return not lt(entry2[0], entry1[0]) and entry1[1] < entry2[1]
+
+        return entry_lt
+
+    def _heapify(self) -> None:
+        """
+        Rearranges the internal heap list into heap order.
+        """
+
+        if self._heapq:
+            heapify(self._heap)
             return
 
-        right = child + 1
+        for index in reversed(range(len(self._heap) // 2)):
+            self._sift_down(index)
+
+    def _pop(self) -> Entry[P, T]:
+        """
+        Removes and returns the first entry of a non-empty heap
+        that is not maintained by `heapq`.
+        """
+
+        heap = self._heap
+        last = heap.pop()
+
+        if not heap:
+            return last
 
-        if right < len(self._heap) and self.comparer.lt(
-            self._heap[right][0], self._heap[child][0]
-        ):
-            child = right
+        top = heap[0]
+        heap[0] = last
+        self._sift_down(0)
 
-        if self.comparer.lt(self._heap[child][0], self._heap[index][0]):
-            self._swap(child, index)
-            self._heapify_down(child)
+        return top
 
-    def _swap(self, i: int, j: int) -> None:
+    def _replace_first(self, entries: List[Entry[P, T]]) -> None:
         """
-        Swaps two elements in the internal heap list.
+        Replaces the first entry of a non-empty heap with every entry that
+        is ordered after it, and drops the others.
         """
 
-        self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
+        heap = self._heap
+        lt = self._lt
+
+        if self._heapq:
+            for entry in entries:
+                if lt(heap[0], entry):
+                    heapreplace(heap, entry)
+        else:
+            for entry in entries:
+                if lt(heap[0], entry):
+                    heap[0] = entry
+                    self._sift_down(0)
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Moves the element at the given index up, shifting the parents
+        it passes down into the hole it leaves.
+        """
+
+        heap = self._heap
+        lt = self._lt
+        arity = self._arity
+        entry = heap[index]
+
+        while index > 0:
+            parent = (index - 1) // arity
+            parent_entry = heap[parent]
+
+            if not lt(entry, parent_entry):
+                break
+
+            heap[index] = parent_entry
+            index = parent
+
+        heap[index] = entry
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Moves the element at the given index down, shifting the children
+        it passes up into the hole it leaves.
+        """
+
+        heap = self._heap
+        lt = self._lt
+        arity = self._arity
+        size = len(heap)
+        entry = heap[index]
+        child = arity * index + 1
+
+        while child < size:
+            best = heap[child]
+            best_index = child
+
+            for other in range(child + 1, min(child + arity, size)):
+                if lt(heap[other], best):
+                    best = heap[other]
+                    best_index = other
+
+            if not lt(best, entry):
+                break
+
+            heap[index] = best
+            index = best_index
+            child = arity * index + 1
+
+        heap[index] = entry
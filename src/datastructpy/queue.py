@@ -4,47 +4,118 @@ Contains a FIFO (First-In-First-Out) queue implementation.
 
 import copy
 
-from typing import Generic, List, Iterator, Optional, TypeVar
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    List,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from .exceptions import EmptyCollectionException
+from .exceptions import EmptyCollectionException, FullCollectionException
 from .protocols import Comparable
 
 
 T = TypeVar("T", bound=Comparable)
 
+_MIN_CAPACITY = 8
+_OVERFLOW_POLICIES = ("reject", "overwrite")
+
 
 class Queue(Generic[T]):
     """
     Represents a FIFO (First-In-First-Out) queue.
+
+    The elements are stored in a growable ring buffer, so adding, removing
+    and accessing an element by index take constant time. The buffer
+    doubles when it is full, and halves when it is less than a quarter
+    full.
+
+    A queue with a `maxlen` holds at most `maxlen` elements. Adding an
+    element to a full queue raises `FullCollectionException` with the
+    `reject` overflow policy, and drops the oldest element with the
+    `overwrite` policy.
+
+    A snapshot shares the buffer with the queue it was taken from. The
+    buffer is copied by the first of them to be modified afterwards.
     """
 
-    def __init__(self, values: Optional[List[T]] = None) -> None:
+    def __init__(
+        self,
+        values: Optional[List[T]] = None,
+        maxlen: Optional[int] = None,
+        overflow: str = "reject",
+    ) -> None:
         """
         Initializes a new queue instance.
         """
 
-        self._list: List[T] = [] if not values else values
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("Max length should be a positive integer.")
+
+        if overflow not in _OVERFLOW_POLICIES:
+            # pylint: disable-next=line-too-long
+            raise ValueError(f"Overflow policy should be one of {_OVERFLOW_POLICIES}.")
+
+        self._maxlen: Optional[int] = maxlen
+        self._overflow: str = overflow
+        self._buffer: List[Any] = [None] * self._capacity_for(0)
+        self._head: int = 0
+        self._size: int = 0
+        self._owners: List[int] = [1]
+
+        if values:
+            self.enqueue_many(values)
 
     def __iter__(self) -> Iterator[T]:
         """
         Iterates through the queue.
         """
 
-        yield from self._list
+        buffer = self._buffer
+        capacity = len(buffer)
+        head = self._head
+
+        for offset in range(self._size):
+            yield buffer[(head + offset) % capacity]
 
     def __len__(self) -> int:
         """
         Returns the number of elements in the queue.
         """
 
-        return len(self._list)
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
 
-    def __getitem__(self, index: int) -> T:
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
         """
         Retrieve the element at the specified index from the queue.
         """
 
-        return self._list[index]
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        size = self._size
+
+        if index < 0:
+            index += size
+
+        if not 0 <= index < size:
+            raise IndexError("Queue index out of range.")
+
+        buffer = self._buffer
+        value: T = buffer[(self._head + index) % len(buffer)]
+
+        return value
 
     @property
     def id(self) -> int:
@@ -54,50 +125,255 @@ class Queue(Generic[T]):
 
         return id(self)
 
+    @property
+    def maxlen(self) -> Optional[int]:
+        """
+        Returns the maximum number of elements in the queue,
+        or `None` if the queue is unbounded.
+        """
+
+        return self._maxlen
+
+    @property
+    def overflow(self) -> str:
+        """
+        Returns the policy applied when adding to a full queue.
+        """
+
+        return self._overflow
+
     def clear(self) -> None:
         """
         Removes all the elements from the queue.
         """
 
-        self._list.clear()
+        self._detach()
+        self._buffer = [None] * self._capacity_for(0)
+        self._head = 0
+        self._size = 0
 
     def contains(self, value: T) -> bool:
         """
         Returns `True` if the queue contains the specified value.
         """
 
-        return value in self._list
+        return any(item == value for item in self)
 
-    def copy(self) -> List[T]:
+    def copy(self, deep: bool = False) -> List[T]:
         """
         Returns a new list with the values from the queue.
+        The values themselves are copied only if `deep` is `True`.
         """
 
-        return copy.deepcopy(self._list)
+        values = list(self)
+
+        return copy.deepcopy(values) if deep else values
 
     def dequeue(self) -> Optional[T]:
         """
         Removes and returns the object at the beginning of the queue.
         """
 
-        if len(self) == 0:
+        if not self._size:
             raise EmptyCollectionException("The queue is empty!")
 
-        return self._list.pop(0)
+        return self._popleft()
+
+    def dequeue_many(self, count: int) -> List[T]:
+        """
+        Removes and returns up to `count` objects from the beginning
+        of the queue, copying them out of the buffer in at most two slices.
+        """
+
+        if count < 0:
+            raise ValueError("Count should be a non-negative integer.")
+
+        if self._owners[0] > 1:
+            self._own()
+
+        buffer = self._buffer
+        head = self._head
+        count = min(count, self._size)
+        first = min(count, len(buffer) - head)
+        rest = count - first
+
+        values: List[T] = buffer[head : head + first] + buffer[:rest]
+        buffer[head : head + first] = [None] * first
+        buffer[:rest] = [None] * rest
+
+        self._head = (head + count) % len(buffer)
+        self._size -= count
+
+        if len(buffer) > _MIN_CAPACITY and self._size * 4 < len(buffer):
+            self._resize(self._capacity_for(self._size * 2))
+
+        return values
+
+    def drain(self) -> Iterator[T]:
+        """
+        Removes and yields objects from the beginning of the queue
+        until the queue is empty.
+        """
+
+        while self._size:
+            yield self._popleft()
 
     def enqeue(self, value: T) -> None:
         """
         Adds an object to the end of the queue.
         """
 
-        self._list.append(value)
+        if self._owners[0] > 1:
+            self._own()
+
+        buffer = self._buffer
+        capacity = len(buffer)
+
+        if self._size == capacity:
+            if self._maxlen is None or capacity < self._maxlen:
+                self._resize(self._capacity_for(capacity + 1))
+                buffer = self._buffer
+                capacity = len(buffer)
+            elif self._overflow == "overwrite":
+                buffer[self._head] = value
+                self._head = (self._head + 1) % capacity
+                return
+            else:
+                raise FullCollectionException("The queue is full!")
+
+        buffer[(self._head + self._size) % capacity] = value
+        self._size += 1
+
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        """
+        Adds objects to the end of the queue, copying them into the buffer
+        in at most two slices.
+
+        With the `reject` policy, nothing is added if the objects do not
+        fit. With the `overwrite` policy, the oldest elements are dropped
+        to make room.
+        """
+
+        if self._owners[0] > 1:
+            self._own()
+
+        values = list(values)
+        maxlen = self._maxlen
+
+        if maxlen is not None and self._size + len(values) > maxlen:
+            if self._overflow == "reject":
+                raise FullCollectionException("The queue is full!")
+
+            if len(values) >= maxlen:
+                self.clear()
+                values = values[-maxlen:]
+            else:
+                # The dropped slots are either overwritten below, or left
+                # behind when the buffer grows to `maxlen`.
+                drop = self._size + len(values) - maxlen
+                self._head = (self._head + drop) % len(self._buffer)
+                self._size -= drop
+
+        count = len(values)
+
+        if self._size + count > len(self._buffer):
+            self._resize(self._capacity_for(self._size + count))
+
+        buffer = self._buffer
+        tail = (self._head + self._size) % len(buffer)
+        first = min(count, len(buffer) - tail)
+
+        buffer[tail : tail + first] = values[:first]
+        buffer[: count - first] = values[first:]
+        self._size += count
+
+    def full(self) -> bool:
+        """
+        Returns `True` if the queue holds `maxlen` elements.
+        """
+
+        return self._maxlen is not None and self._size >= self._maxlen
 
     def peek(self) -> Optional[T]:
         """
         Returns the object at the beginning of the queue without removing it.
         """
 
-        if len(self) == 0:
+        if not self._size:
             raise EmptyCollectionException("The queue is empty!")
 
-        return self._list[0]
+        value: T = self._buffer[self._head]
+
+        return value
+
+    def snapshot(self) -> "Queue[T]":
+        """
+        Returns a queue with the same elements in constant time.
+        It shares the buffer with this queue until either is modified.
+        """
+
+        clone = copy.copy(self)
+        self._owners[0] += 1
+
+        return clone
+
+    def _capacity_for(self, size: int) -> int:
+        """
+        Computes the buffer capacity for the given number of elements:
+        the smallest sufficient power of two, capped at `maxlen`.
+        """
+
+        capacity = _MIN_CAPACITY
+
+        while capacity < size:
+            capacity *= 2
+
+        if self._maxlen is not None:
+            capacity = min(capacity, self._maxlen)
+
+        return capacity
+
+    def _popleft(self) -> T:
+        """
+        Removes and returns the first element of a non-empty queue.
+        """
+
+        if self._owners[0] > 1:
+            self._own()
+
+        buffer = self._buffer
+        value: T = buffer[self._head]
+        buffer[self._head] = None
+        self._head = (self._head + 1) % len(buffer)
+        self._size -= 1
+
+        if len(buffer) > _MIN_CAPACITY and self._size * 4 < len(buffer):
+            self._resize(len(buffer) // 2)
+
+        return value
+
+    def _detach(self) -> None:
+        """
+        Stops sharing the buffer with snapshots, without copying it.
+        The caller replaces the buffer.
+        """
+
+        self._owners[0] -= 1
+        self._owners = [1]
+
+    def _own(self) -> None:
+        """
+        Replaces a buffer shared with snapshots by a copy of it.
+        """
+
+        self._detach()
+        self._buffer = list(self._buffer)
+
+    def _resize(self, capacity: int) -> None:
+        """
+        Moves the elements to the start of a buffer with the given capacity.
+        """
+
+        values: List[Any] = list(self)
+        self._buffer = values + [None] * (capacity - len(values))
+        self._head = 0
@@ -4,7 +4,7 @@ Contains a FILO (First-In-Last-Out) stack implementation.
 
 import copy
 
-from typing import Generic, List, Iterator, Optional, TypeVar
+from typing import Generic, Iterable, List, Iterator, Optional, TypeVar
 
 from .exceptions import EmptyCollectionException
 from .protocols import Comparable
@@ -16,6 +16,9 @@ T = TypeVar("T", bound=Comparable)
 class Stack(Generic[T]):
     """
     Represents a First-In-Last-Out (FILO) stack.
+
+    A snapshot shares the backing list with the stack it was taken from.
+    The list is copied by the first of them to be modified afterwards.
     """
 
     def __init__(self, values: Optional[List[T]] = None) -> None:
@@ -24,6 +27,7 @@ class Stack(Generic[T]):
         """
 
         self._list: List[T] = [] if not values else values
+        self._owners: List[int] = [1]
 
     def __iter__(self) -> Iterator[T]:
         """
@@ -59,7 +63,8 @@ class Stack(Generic[T]):
         Removes all the elements from the stack.
         """
 
-        self._list.clear()
+        self._detach()
+        self._list = []
 
     def contains(self, value: T) -> bool:
         """
@@ -68,12 +73,25 @@ class Stack(Generic[T]):
 
         return value in self._list
 
-    def copy(self) -> List[T]:
+    def copy(self, deep: bool = False) -> List[T]:
         """
         Returns a new list with the values from the stack.
+        The values themselves are copied only if `deep` is `True`.
+        """
+
+        return copy.deepcopy(self._list) if deep else list(self._list)
+
+    def drain(self) -> Iterator[T]:
+        """
+        Removes and yields objects from the top of the stack
+        until the stack is empty.
         """
 
-        return copy.deepcopy(self._list)
+        while self._list:
+            if self._owners[0] > 1:
+                self._own()
+
+            yield self._list.pop()
 
     def peek(self) -> Optional[T]:
         """
@@ -93,11 +111,78 @@ class Stack(Generic[T]):
         if len(self) == 0:
             raise EmptyCollectionException("The stack is empty!")
 
+        if self._owners[0] > 1:
+            self._own()
+
         return self._list.pop()
 
+    def pop_many(self, count: int) -> List[T]:
+        """
+        Removes and returns up to `count` objects from the top of the stack,
+        starting with the topmost one.
+        """
+
+        if count < 0:
+            raise ValueError("Count should be a non-negative integer.")
+
+        count = min(count, len(self._list))
+
+        if not count:
+            return []
+
+        if self._owners[0] > 1:
+            self._own()
+
+        values = self._list[-count:]
+        del self._list[-count:]
+        values.reverse()
+
+        return values
+
     def push(self, value: T) -> None:
         """
         Inserts an object at the top of the stack.
         """
 
+        if self._owners[0] > 1:
+            self._own()
+
         self._list.append(value)
+
+    def push_many(self, values: Iterable[T]) -> None:
+        """
+        Inserts objects at the top of the stack, in iteration order.
+        """
+
+        if self._owners[0] > 1:
+            self._own()
+
+        self._list.extend(values)
+
+    def snapshot(self) -> "Stack[T]":
+        """
+        Returns a stack with the same elements in constant time.
+        It shares the backing list with this stack until either is modified.
+        """
+
+        clone = copy.copy(self)
+        self._owners[0] += 1
+
+        return clone
+
+    def _detach(self) -> None:
+        """
+        Stops sharing the backing list with snapshots, without copying it.
+        The caller replaces the list.
+        """
+
+        self._owners[0] -= 1
+        self._owners = [1]
+
+    def _own(self) -> None:
+        """
+        Replaces a backing list shared with snapshots by a copy of it.
+        """
+
+        self._detach()
+        self._list = list(self._list)
@@ -0,0 +1,382 @@
+"""
+Contains a timer scheduler based on a hierarchical timing wheel.
+"""
+
+# pylint: disable=protected-access
+
+import math
+
+from typing import Generic, List, Optional, TypeVar, final
+
+from .priority_queue import PriorityQueue
+
+
+T = TypeVar("T")
+
+
+@final
+class TimerHandle(Generic[T]):
+    """
+    Represents a timer scheduled by a `TimerScheduler`.
+    """
+
+    __slots__ = ("_deadline", "_sequence", "_tick", "_scheduler", "item")
+
+    def __init__(
+        self,
+        deadline: float,
+        sequence: int,
+        tick: int,
+        scheduler: "TimerScheduler[T]",
+        item: T,
+    ) -> None:
+        """
+        Initializes a new handle for a timer due at the given tick.
+        """
+
+        self._deadline: float = deadline
+        self._sequence: int = sequence
+        self._tick: int = tick
+        self._scheduler: Optional["TimerScheduler[T]"] = scheduler
+
+        self.item: T = item
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    @property
+    def deadline(self) -> float:
+        """
+        Returns the time at which the timer is due.
+        """
+
+        return self._deadline
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns `True` if the timer neither fired nor was cancelled.
+        """
+
+        return self._scheduler is not None
+
+
+class TimerScheduler(Generic[T]):
+    """
+    Represents a scheduler of timers keyed by deadline.
+
+    Deadlines are rounded up to ticks of `resolution` time units. Timers
+    due within `wheel_size ** levels` ticks are kept in a hierarchical
+    timing wheel, where scheduling takes constant time, and farther timers
+    are kept in a `PriorityQueue` until they come within the range of the
+    wheel. A timer therefore never fires early, and fires at most one
+    tick late. Advancing the clock jumps over the ticks at which no slot
+    is occupied and no level is redistributed.
+
+    Cancelled timers are only marked as dead and purged lazily, when their
+    slot is reached or they leave the priority queue. Once dead timers
+    make up more than `compact_threshold` of the stored timers, the wheel
+    and the queue are compacted.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        resolution: float = 1.0,
+        wheel_size: int = 256,
+        levels: int = 3,
+        compact_threshold: float = 0.5,
+        start: float = 0.0,
+    ) -> None:
+        """
+        Initializes a new scheduler whose clock is at `start`.
+        """
+
+        if resolution <= 0:
+            raise ValueError("Resolution should be a positive number.")
+
+        if wheel_size < 2:
+            raise ValueError("Wheel size should be an integer greater than 1.")
+
+        if levels < 1:
+            raise ValueError("Number of levels should be a positive integer.")
+
+        if not 0 < compact_threshold < 1:
+            raise ValueError("Compact threshold should be between 0 and 1.")
+
+        self._resolution: float = resolution
+        self._wheel_size: int = wheel_size
+        self._levels: int = levels
+        self._horizon: int = wheel_size**levels
+        self._compact_threshold: float = compact_threshold
+        self._tick: int = math.floor(start / resolution)
+        self._wheels: List[List[List[TimerHandle[T]]]] = [
+            [[] for _ in range(wheel_size)] for _ in range(levels)
+        ]
+        self._far: PriorityQueue[float, TimerHandle[T]] = PriorityQueue()
+        self._expired: List[TimerHandle[T]] = []
+        self._sequence: int = 0
+        self._counts: List[int] = [0] * levels
+        self._live: int = 0
+        self._dead: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of active timers.
+        """
+
+        return self._live
+
+    @property
+    def resolution(self) -> float:
+        """
+        Returns the duration of a tick.
+        """
+
+        return self._resolution
+
+    @property
+    def stored(self) -> int:
+        """
+        Returns the number of stored timers, including the cancelled ones
+        that were not purged yet.
+        """
+
+        return self._live + self._dead
+
+    @property
+    def time(self) -> float:
+        """
+        Returns the time of the last tick the scheduler advanced to.
+        """
+
+        return self._tick * self._resolution
+
+    def advance(self, now: float) -> List[T]:
+        """
+        Moves the clock forward to `now`, and returns the items of the
+        timers that became due, ordered by deadline.
+        """
+
+        target = math.floor(now / self._resolution)
+        due = self._expired
+        self._expired = []
+
+        while self._tick < target:
+            if not any(self._counts):
+                # Nothing is stored in the wheel, so the empty ticks up to
+                # the target or the next far timer can be skipped at once.
+                self._tick = target
+                self._pull_far(due)
+                break
+
+            self._tick = self._next_tick(target)
+            self._turn(due)
+            self._pull_far(due)
+
+        live = [handle for handle in due if handle._scheduler is self]
+        self._dead -= len(due) - len(live)
+        self._live -= len(live)
+        live.sort(key=lambda handle: (handle._deadline, handle._sequence))
+
+        for handle in live:
+            handle._scheduler = None
+
+        return [handle.item for handle in live]
+
+    def cancel(self, handle: TimerHandle[T]) -> bool:
+        """
+        Cancels the timer referred to by the handle in constant time.
+        Returns `False` if the timer already fired or was cancelled.
+        """
+
+        if handle._scheduler is not self:
+            return False
+
+        handle._scheduler = None
+        self._live -= 1
+        self._dead += 1
+
+        stored = self._live + self._dead
+
+        if (
+            self._dead >= self._wheel_size
+            and self._dead > self._compact_threshold * stored
+        ):
+            self.compact()
+
+        return True
+
+    def clear(self) -> None:
+        """
+        Cancels all the timers.
+        """
+
+        for handle in self._handles():
+            handle._scheduler = None
+
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+
+        self._far.clear()
+        self._expired = []
+        self._counts = [0] * self._levels
+        self._live = self._dead = 0
+
+    def compact(self) -> None:
+        """
+        Purges the cancelled timers from the wheel and the queue.
+        """
+
+        for level, wheel in enumerate(self._wheels):
+            count = 0
+
+            for index, slot in enumerate(wheel):
+                if slot:
+                    wheel[index] = [h for h in slot if h._scheduler is self]
+                    count += len(wheel[index])
+
+            self._counts[level] = count
+
+        far = [h for h in self._far.drain() if h._scheduler is self]
+        self._far.enqueue_many((handle._deadline, handle) for handle in far)
+        self._expired = [h for h in self._expired if h._scheduler is self]
+        self._dead = 0
+
+    def schedule(self, deadline: float, item: T) -> TimerHandle[T]:
+        """
+        Schedules an item to become due at `deadline`, and returns
+        the handle of its timer.
+        """
+
+        tick = math.ceil(deadline / self._resolution)
+        handle = TimerHandle(deadline, self._sequence, tick, self, item)
+        self._sequence += 1
+        self._live += 1
+
+        if tick - self._tick >= self._horizon:
+            self._far.enqueue(deadline, handle)
+        else:
+            self._place(handle, self._expired)
+
+        return handle
+
+    def _handles(self) -> List[TimerHandle[T]]:
+        """
+        Returns all the stored handles, including dead ones.
+        """
+
+        handles = list(self._expired)
+
+        for wheel in self._wheels:
+            for slot in wheel:
+                handles.extend(slot)
+
+        handles.extend(self._far.drain())
+
+        return handles
+
+    def _place(self, handle: TimerHandle[T], due: List[TimerHandle[T]]) -> None:
+        """
+        Stores a handle in the lowest wheel level whose range covers its
+        tick, or adds it to `due` if its tick has passed.
+        """
+
+        delta = handle._tick - self._tick
+
+        if delta <= 0:
+            due.append(handle)
+            return
+
+        size = self._wheel_size
+        span = 1
+        level = 0
+
+        while delta >= span * size:
+            span *= size
+            level += 1
+
+        self._wheels[level][(handle._tick // span) % size].append(handle)
+        self._counts[level] += 1
+
+    def _next_tick(self, target: int) -> int:
+        """
+        Returns the first tick after the current one, and at most `target`,
+        at which a slot of the lowest level is occupied, the occupied upper
+        levels are redistributed, or a far timer comes within range.
+        """
+
+        tick = self._tick
+        size = self._wheel_size
+        stop = target
+
+        if len(self._far):
+            pull = self._far.peek()._tick - self._horizon + 1
+            stop = min(stop, max(pull, tick + 1))
+
+        if any(self._counts[1:]):
+            # Every upper level starts its slots at multiples of the size.
+            stop = min(stop, (tick // size + 1) * size)
+
+        if self._counts[0]:
+            slots = self._wheels[0]
+
+            for next_tick in range(tick + 1, min(stop, tick + size)):
+                if slots[next_tick % size]:
+                    return next_tick
+
+        return stop
+
+    def _pull_far(self, due: List[TimerHandle[T]]) -> None:
+        """
+        Moves the far timers that came within the range of the wheel
+        into the wheel, dropping the cancelled ones.
+        """
+
+        far = self._far
+        limit = self._tick + self._horizon
+
+        while len(far) and far.peek()._tick < limit:
+            handle = far.dequeue()
+
+            if handle._scheduler is self:
+                self._place(handle, due)
+            else:
+                self._dead -= 1
+
+    def _turn(self, due: List[TimerHandle[T]]) -> None:
+        """
+        Processes the current tick: redistributes the slots of the upper
+        levels that start at this tick, then collects the handles of the
+        slot of the lowest level.
+        """
+
+        tick = self._tick
+        size = self._wheel_size
+        wheels = self._wheels
+        span = self._horizon // size
+
+        for level in range(self._levels - 1, 0, -1):
+            if not tick % span:
+                index = (tick // span) % size
+                slot = wheels[level][index]
+                wheels[level][index] = []
+                self._counts[level] -= len(slot)
+
+                for handle in slot:
+                    if handle._scheduler is self:
+                        self._place(handle, due)
+                    else:
+                        self._dead -= 1
+
+            span //= size
+
+        index = tick % size
+        slot = wheels[0][index]
+        wheels[0][index] = []
+        self._counts[0] -= len(slot)
+        due.extend(slot)
@@ -0,0 +1,216 @@
+"""
+Contains a FIFO (First-In-First-Out) queue of unboxed numbers.
+"""
+
+from array import array
+from itertools import islice
+from typing import Any, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from .exceptions import EmptyCollectionException
+
+
+N = TypeVar("N", int, float)
+
+_COMPACT_MIN = 1024
+
+
+class TypedQueue(Generic[N]):
+    """
+    Represents a FIFO (First-In-First-Out) queue of numbers.
+
+    The values are stored unboxed in an `array` with the given typecode.
+    Dequeuing advances a head offset, and the consumed prefix is removed
+    once it makes up half of the array, so the values always occupy one
+    contiguous block. The queue supports the buffer protocol, so its
+    contents can be handed to NumPy or written to a file without copying.
+    The queue cannot grow while a memory view of it is alive, and the
+    removal of the consumed prefix is postponed until the view is released.
+    """
+
+    # pylint: disable-next=line-too-long
+    def __init__(self, typecode: str, values: Optional[Iterable[N]] = None) -> None:
+        """
+        Initializes a new queue instance holding values of the given
+        `array` typecode.
+        """
+
+        # pylint: disable-next=line-too-long
+        self._array: "array[Any]" = array(typecode, [] if values is None else values)
+        self._head: int = 0
+
+    # pylint: disable-next=unused-argument
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exposes the values through the buffer protocol.
+        """
+
+        return self.view()
+
+    def __iter__(self) -> Iterator[N]:
+        """
+        Iterates through the queue.
+        """
+
+        yield from islice(self._array, self._head, None)
+
+    def __getitem__(self, index: int) -> N:
+        """
+        Retrieve the element at the specified index from the queue.
+        """
+
+        size = len(self)
+
+        if index < 0:
+            index += size
+
+        if not 0 <= index < size:
+            raise IndexError("Queue index out of range.")
+
+        value: N = self._array[self._head + index]
+
+        return value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the queue.
+        """
+
+        return len(self._array) - self._head
+
+    @property
+    def id(self) -> int:
+        """
+        Returns a unique identifier for this queue.
+        """
+
+        return id(self)
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns the typecode of the array holding the values.
+        """
+
+        return self._array.typecode
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the queue.
+        """
+
+        self._array = array(self._array.typecode)
+        self._head = 0
+
+    def contains(self, value: N) -> bool:
+        """
+        Returns `True` if the queue contains the specified value.
+        """
+
+        try:
+            self._array.index(value, self._head)
+        except ValueError:
+            return False
+
+        return True
+
+    def copy(self) -> "array[Any]":
+        """
+        Returns a new array with the values from the queue.
+        """
+
+        return self._array[self._head :]
+
+    def dequeue(self) -> N:
+        """
+        Removes and returns the object at the beginning of the queue.
+        """
+
+        if self._head == len(self._array):
+            raise EmptyCollectionException("The queue is empty!")
+
+        value: N = self._array[self._head]
+        self._head += 1
+        self._compact()
+
+        return value
+
+    def dequeue_many(self, count: int) -> List[N]:
+        """
+        Removes and returns up to `count` objects from the beginning
+        of the queue.
+        """
+
+        if count < 0:
+            raise ValueError("Count should be a non-negative integer.")
+
+        head = self._head
+        count = min(count, len(self._array) - head)
+        values: List[N] = self._array[head : head + count].tolist()
+        self._head += count
+        self._compact()
+
+        return values
+
+    def drain(self) -> Iterator[N]:
+        """
+        Removes and yields objects from the beginning of the queue
+        until the queue is empty.
+        """
+
+        while self._head < len(self._array):
+            yield self.dequeue()
+
+    def enqeue(self, value: N) -> None:
+        """
+        Adds an object to the end of the queue.
+        """
+
+        self._array.append(value)
+
+    def enqueue_many(self, values: Iterable[N]) -> None:
+        """
+        Adds objects to the end of the queue.
+        Nothing is added if a value does not fit the typecode.
+        """
+
+        self._array.extend(array(self._array.typecode, values))
+
+    def peek(self) -> N:
+        """
+        Returns the object at the beginning of the queue without removing it.
+        """
+
+        if self._head == len(self._array):
+            raise EmptyCollectionException("The queue is empty!")
+
+        value: N = self._array[self._head]
+
+        return value
+
+    def view(self) -> memoryview:
+        """
+        Returns a memory view of the values, from the beginning of the
+        queue to its end.
+        """
+
+        with memoryview(self._array) as view:
+            return view[self._head :]
+
+    def _compact(self) -> None:
+        """
+        Removes the consumed prefix of the array once it makes up half
+        of the array, which keeps dequeuing amortized constant time.
+        """
+
+        head = self._head
+
+        if head == len(self._array):
+            self._array = array(self._array.typecode)
+            self._head = 0
+        elif head >= _COMPACT_MIN and head * 2 >= len(self._array):
+            try:
+                del self._array[:head]
+            except BufferError:
+                return
+
+            self._head = 0
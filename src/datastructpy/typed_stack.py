@@ -0,0 +1,178 @@
+"""
+Contains a FILO (First-In-Last-Out) stack of unboxed numbers.
+"""
+
+from array import array
+from typing import Any, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from .exceptions import EmptyCollectionException
+
+
+N = TypeVar("N", int, float)
+
+
+class TypedStack(Generic[N]):
+    """
+    Represents a First-In-Last-Out (FILO) stack of numbers.
+
+    The values are stored unboxed in an `array` with the given typecode.
+    The stack supports the buffer protocol, so its contents can be handed
+    to NumPy or written to a file without copying. The stack cannot grow
+    or shrink while a memory view of it is alive.
+    """
+
+    # pylint: disable-next=line-too-long
+    def __init__(self, typecode: str, values: Optional[Iterable[N]] = None) -> None:
+        """
+        Initializes a new stack instance holding values of the given
+        `array` typecode.
+        """
+
+        # pylint: disable-next=line-too-long
+        self._array: "array[Any]" = array(typecode, [] if values is None else values)
+
+    # pylint: disable-next=unused-argument
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exposes the values through the buffer protocol.
+        """
+
+        return self.view()
+
+    def __iter__(self) -> Iterator[N]:
+        """
+        Iterates through the stack.
+        """
+
+        yield from self._array
+
+    def __getitem__(self, index: int) -> N:
+        """
+        Retrieve the element at the specified index from the stack.
+        """
+
+        value: N = self._array[index]
+
+        return value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the stack.
+        """
+
+        return len(self._array)
+
+    @property
+    def id(self) -> int:
+        """
+        Returns a unique identifier for this stack.
+        """
+
+        return id(self)
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns the typecode of the array holding the values.
+        """
+
+        return self._array.typecode
+
+    def clear(self) -> None:
+        """
+        Removes all the elements from the stack.
+        """
+
+        self._array = array(self._array.typecode)
+
+    def contains(self, value: N) -> bool:
+        """
+        Returns `True` if the stack contains the specified value.
+        """
+
+        return value in self._array
+
+    def copy(self) -> "array[Any]":
+        """
+        Returns a new array with the values from the stack.
+        """
+
+        return array(self._array.typecode, self._array)
+
+    def drain(self) -> Iterator[N]:
+        """
+        Removes and yields objects from the top of the stack
+        until the stack is empty.
+        """
+
+        values = self._array
+
+        while values:
+            yield values.pop()
+
+    def peek(self) -> N:
+        """
+        Returns the object at the top of the stack without removing it.
+        """
+
+        if not self._array:
+            raise EmptyCollectionException("The stack is empty!")
+
+        value: N = self._array[-1]
+
+        return value
+
+    def pop(self) -> N:
+        """
+        Removes and returns the object at the top of the stack.
+        """
+
+        if not self._array:
+            raise EmptyCollectionException("The stack is empty!")
+
+        value: N = self._array.pop()
+
+        return value
+
+    def pop_many(self, count: int) -> List[N]:
+        """
+        Removes and returns up to `count` objects from the top of the stack,
+        starting with the topmost one.
+        """
+
+        if count < 0:
+            raise ValueError("Count should be a non-negative integer.")
+
+        count = min(count, len(self._array))
+
+        if not count:
+            return []
+
+        values: List[N] = self._array[-count:].tolist()
+        del self._array[-count:]
+        values.reverse()
+
+        return values
+
+    def push(self, value: N) -> None:
+        """
+        Inserts an object at the top of the stack.
+        """
+
+        self._array.append(value)
+
+    def push_many(self, values: Iterable[N]) -> None:
+        """
+        Inserts objects at the top of the stack, in iteration order.
+        Nothing is inserted if a value does not fit the typecode.
+        """
+
+        self._array.extend(array(self._array.typecode, values))
+
+    def view(self) -> memoryview:
+        """
+        Returns a memory view of the values, from the bottom of the stack
+        to its top.
+        """
+
+        return memoryview(self._array)
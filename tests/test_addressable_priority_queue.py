@@ -0,0 +1,94 @@
+"""
+The module contains the AddressablePriorityQueue test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import random
+import unittest
+
+from src.datastructpy import (
+    AddressablePriorityQueue,
+    DefaultComparer,
+    EmptyCollectionException,
+)
+
+
+class ReverseComparer(DefaultComparer[int]):
+    def lt(self, value1: int, value2: int) -> bool:
+        return value1 > value2
+
+
+class TestAddressablePriorityQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.queue = AddressablePriorityQueue[int, str]()
+
+    def test_enqueue_and_dequeue(self) -> None:
+        self.queue.enqueue(3, "low")
+        self.queue.enqueue(1, "high")
+        self.queue.enqueue(2, "medium")
+        self.assertEqual(self.queue.peek(), "high")
+        self.assertEqual(self.queue.dequeue(), "high")
+        self.assertEqual(self.queue.dequeue(), "medium")
+        self.assertEqual(self.queue.dequeue(), "low")
+
+        with self.assertRaises(EmptyCollectionException):
+            self.queue.dequeue()
+
+    def test_update_priority(self) -> None:
+        low = self.queue.enqueue(3, "low")
+        high = self.queue.enqueue(1, "high")
+        self.queue.enqueue(2, "medium")
+
+        self.queue.update_priority(low, 0)
+        self.assertEqual(low.priority, 0)
+        self.assertEqual(self.queue.peek(), "low")
+
+        self.queue.update_priority(low, 5)
+        self.queue.update_priority(high, 4)
+        self.assertEqual(self.queue.dequeue(), "medium")
+        self.assertEqual(self.queue.dequeue(), "high")
+
+    def test_remove_and_contains(self) -> None:
+        handle = self.queue.enqueue(1, "a")
+        self.queue.enqueue(2, "b")
+        self.assertTrue(self.queue.contains(handle))
+        self.assertEqual(self.queue.remove(handle), "a")
+        self.assertFalse(self.queue.contains(handle))
+        self.assertEqual(len(self.queue), 1)
+
+        with self.assertRaises(ValueError):
+            self.queue.remove(handle)
+
+        with self.assertRaises(ValueError):
+            self.queue.update_priority(handle, 0)
+
+    def test_random_operations(self) -> None:
+        self.queue.comparer = ReverseComparer()
+        handles = [self.queue.enqueue(i, str(i)) for i in range(300)]
+        expected = {}
+
+        for handle in handles:
+            if random.random() < 0.3:
+                self.queue.remove(handle)
+            else:
+                priority = random.randint(0, 1000)
+                self.queue.update_priority(handle, priority)
+                expected[handle.value] = priority
+
+        result = []
+
+        while len(self.queue):
+            result.append(expected[self.queue.dequeue()])
+
+        self.assertEqual(result, sorted(expected.values(), reverse=True))
+
+    def test_clear(self) -> None:
+        handle = self.queue.enqueue(1, "a")
+        self.queue.clear()
+        self.assertEqual(len(self.queue), 0)
+        self.assertFalse(self.queue.contains(handle))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+The module contains the AsyncPriorityQueue test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import asyncio
+import unittest
+
+from typing import List
+
+from src.datastructpy import (
+    AsyncPriorityQueue,
+    DefaultComparer,
+    EmptyCollectionException,
+    FullCollectionException,
+)
+
+
+class ReverseComparer(DefaultComparer[int]):
+    def lt(self, value1: int, value2: int) -> bool:
+        return value1 > value2
+
+
+class TestAsyncPriorityQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_put_and_get(self) -> None:
+        queue = AsyncPriorityQueue[int, str]()
+        await queue.put(3, "low")
+        await queue.put(1, "high")
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(await queue.get(), "high")
+        self.assertEqual(await queue.get(), "low")
+
+    async def test_custom_comparer(self) -> None:
+        queue = AsyncPriorityQueue[int, str]()
+        queue.comparer = ReverseComparer()
+        queue.put_nowait(3, "low")
+        queue.put_nowait(1, "high")
+        self.assertEqual(queue.get_nowait(), "low")
+
+    async def test_nowait(self) -> None:
+        queue = AsyncPriorityQueue[int, str](maxsize=1)
+
+        with self.assertRaises(EmptyCollectionException):
+            queue.get_nowait()
+
+        queue.put_nowait(1, "a")
+
+        with self.assertRaises(FullCollectionException):
+            queue.put_nowait(2, "b")
+
+    async def test_get_waits_for_put(self) -> None:
+        queue = AsyncPriorityQueue[int, str]()
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await queue.put(1, "a")
+        self.assertEqual(await getter, "a")
+
+    async def test_get_timeout(self) -> None:
+        queue = AsyncPriorityQueue[int, str]()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.get(), 0.01)
+
+        await queue.put(1, "a")
+        self.assertEqual(await queue.get(), "a")
+
+    async def test_producers_and_consumers(self) -> None:
+        queue = AsyncPriorityQueue[int, int](maxsize=2)
+        results: List[int] = []
+
+        async def produce(start: int) -> None:
+            for i in range(start, start + 50):
+                await queue.put(i, i)
+
+        async def consume() -> None:
+            while True:
+                results.append(await queue.get())
+                queue.task_done()
+
+        consumers = [asyncio.ensure_future(consume()) for _ in range(2)]
+        await asyncio.gather(*(produce(i * 50) for i in range(3)))
+        await queue.join()
+
+        for consumer in consumers:
+            consumer.cancel()
+
+        self.assertEqual(sorted(results), list(range(150)))
+
+
+if __name__ == "__main__":
+    unittest.main()
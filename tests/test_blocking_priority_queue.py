@@ -0,0 +1,99 @@
+"""
+The module contains the BlockingPriorityQueue test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import threading
+import unittest
+
+from typing import List
+
+from src.datastructpy import (
+    BlockingPriorityQueue,
+    DefaultComparer,
+    EmptyCollectionException,
+    FullCollectionException,
+)
+
+
+class ReverseComparer(DefaultComparer[int]):
+    def lt(self, value1: int, value2: int) -> bool:
+        return value1 > value2
+
+
+class TestBlockingPriorityQueue(unittest.TestCase):
+    def test_put_and_get(self) -> None:
+        queue = BlockingPriorityQueue[int, str]()
+        queue.put(3, "low")
+        queue.put(1, "high")
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.get(), "high")
+        self.assertEqual(queue.get(), "low")
+
+    def test_custom_comparer(self) -> None:
+        queue = BlockingPriorityQueue[int, str]()
+        queue.comparer = ReverseComparer()
+        queue.put(3, "low")
+        queue.put(1, "high")
+        self.assertEqual(queue.get(), "low")
+
+    def test_get_timeout(self) -> None:
+        queue = BlockingPriorityQueue[int, str]()
+
+        with self.assertRaises(EmptyCollectionException):
+            queue.get(timeout=0.01)
+
+        with self.assertRaises(EmptyCollectionException):
+            queue.get(block=False)
+
+    def test_put_timeout(self) -> None:
+        queue = BlockingPriorityQueue[int, str](maxsize=1)
+        queue.put(1, "a")
+
+        with self.assertRaises(FullCollectionException):
+            queue.put(2, "b", timeout=0.01)
+
+        with self.assertRaises(FullCollectionException):
+            queue.put(2, "b", block=False)
+
+    def test_producers_and_consumers(self) -> None:
+        queue = BlockingPriorityQueue[int, int](maxsize=4)
+        results: List[int] = []
+        lock = threading.Lock()
+
+        def produce(start: int) -> None:
+            for i in range(start, start + 100):
+                queue.put(i, i)
+
+        def consume() -> None:
+            for _ in range(100):
+                value = queue.get(timeout=5)
+
+                with lock:
+                    results.append(value)
+
+                queue.task_done()
+
+        threads = [threading.Thread(target=produce, args=(i * 100,)) for i in range(3)]
+        threads += [threading.Thread(target=consume) for _ in range(3)]
+
+        for thread in threads:
+            thread.start()
+
+        queue.join()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), list(range(300)))
+
+    def test_task_done_too_many_times(self) -> None:
+        queue = BlockingPriorityQueue[int, str]()
+
+        with self.assertRaises(ValueError):
+            queue.task_done()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+The module contains the BlockingQueue test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import threading
+import unittest
+
+from typing import List
+
+from src.datastructpy import (
+    BlockingQueue,
+    ClosedCollectionException,
+    EmptyCollectionException,
+    FullCollectionException,
+)
+
+
+class TestBlockingQueue(unittest.TestCase):
+    def test_queue_interface(self) -> None:
+        queue = BlockingQueue[int]([1, 2, 3])
+        queue.enqeue(4)
+        self.assertEqual(len(queue), 4)
+        self.assertEqual(queue.peek(), 1)
+        self.assertEqual(queue.dequeue(), 1)
+        self.assertEqual(queue[0], 2)
+        self.assertTrue(queue.contains(4))
+        self.assertEqual(list(queue), [2, 3, 4])
+        self.assertEqual(queue.dequeue_many(2), [2, 3])
+        queue.enqueue_many([5, 6])
+        self.assertEqual(list(queue.drain()), [4, 5, 6])
+
+        with self.assertRaises(EmptyCollectionException):
+            queue.dequeue(block=False)
+
+    def test_timeouts(self) -> None:
+        queue = BlockingQueue[int](maxlen=1)
+
+        with self.assertRaises(EmptyCollectionException):
+            queue.get(timeout=0.01)
+
+        queue.put(1)
+        self.assertTrue(queue.full())
+
+        with self.assertRaises(FullCollectionException):
+            queue.put(2, timeout=0.01)
+
+        with self.assertRaises(FullCollectionException):
+            queue.put(2, block=False)
+
+    def test_overwrite(self) -> None:
+        queue = BlockingQueue[int]([1, 2], maxlen=3, overflow="overwrite")
+        self.assertEqual(queue.maxlen, 3)
+        self.assertEqual(queue.overflow, "overwrite")
+
+        queue.put(3, block=False)
+        queue.put(4, block=False)
+        queue.put_many([5, 6])
+        self.assertTrue(queue.full())
+        self.assertEqual(list(queue), [4, 5, 6])
+
+        for _ in range(3):
+            queue.get()
+            queue.task_done()
+
+        queue.join()
+
+        with self.assertRaises(ValueError):
+            BlockingQueue[int](overflow="block")
+
+    def test_snapshot(self) -> None:
+        queue = BlockingQueue[int]([1, 2, 3], maxlen=4)
+        snapshot = queue.snapshot()
+        queue.put(4)
+        self.assertEqual(snapshot.get(), 1)
+        snapshot.task_done()
+
+        self.assertEqual(list(queue), [1, 2, 3, 4])
+        self.assertEqual(list(snapshot), [2, 3])
+        self.assertEqual(snapshot.maxlen, 4)
+
+    def test_close(self) -> None:
+        queue = BlockingQueue[int]([1, 2])
+        results: List[object] = []
+
+        def consume() -> None:
+            try:
+                while True:
+                    results.append(queue.get(timeout=5))
+            except ClosedCollectionException as exception:
+                results.append(exception)
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        queue.close()
+        thread.join(timeout=5)
+
+        self.assertTrue(queue.closed)
+        self.assertEqual(results[:2], [1, 2])
+        self.assertIsInstance(results[2], ClosedCollectionException)
+
+        with self.assertRaises(ClosedCollectionException):
+            queue.put(3)
+
+        queue = BlockingQueue[int]([1, 2])
+        queue.close(immediate=True)
+        queue.join()
+
+        with self.assertRaises(ClosedCollectionException):
+            queue.get()
+
+    def test_batches(self) -> None:
+        queue = BlockingQueue[int](maxlen=10)
+        results: List[int] = []
+
+        def consume() -> None:
+            try:
+                while True:
+                    batch = queue.get_many(4, timeout=5)
+                    self.assertLessEqual(len(batch), 4)
+                    results.extend(batch)
+
+                    for _ in batch:
+                        queue.task_done()
+            except ClosedCollectionException:
+                pass
+
+        threads = [threading.Thread(target=consume) for _ in range(3)]
+
+        for thread in threads:
+            thread.start()
+
+        queue.put_many(range(1000))
+        queue.join()
+        queue.close()
+
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(sorted(results), list(range(1000)))
+
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+
+    def test_producers_and_consumers(self) -> None:
+        queue = BlockingQueue[int](maxlen=4)
+        results: List[int] = []
+        lock = threading.Lock()
+
+        def produce(start: int) -> None:
+            for i in range(start, start + 100):
+                queue.put(i)
+
+        def consume() -> None:
+            for _ in range(100):
+                value = queue.get(timeout=5)
+
+                with lock:
+                    results.append(value)
+
+                queue.task_done()
+
+        threads = [threading.Thread(target=produce, args=(i * 100,)) for i in range(3)]
+        threads += [threading.Thread(target=consume) for _ in range(3)]
+
+        for thread in threads:
+            thread.start()
+
+        queue.join()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), list(range(300)))
+
+
+if __name__ == "__main__":
+    unittest.main()
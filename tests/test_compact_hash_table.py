@@ -0,0 +1,96 @@
+"""
+The module contains a test case for CompactHashTable.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import unittest
+
+from src.datastructpy import CompactHashTable
+
+
+class TestCompactHashTable(unittest.TestCase):
+    def test_count(self) -> None:
+        table = CompactHashTable[int]()
+        table.add("hello", 1)
+        self.assertEqual(len(table), 1)
+        table.add("world", 2)
+        self.assertEqual(len(table), 2)
+        table.add("hello", 3)
+        self.assertEqual(len(table), 2)
+        table.remove("hello")
+        self.assertEqual(len(table), 1)
+
+    def test_add_and_contains(self) -> None:
+        table = CompactHashTable[int]()
+        table.add("zero", 0)
+        self.assertTrue(table.contains("zero"))
+        self.assertFalse(table.contains("one"))
+
+    def test_find_and_remove(self) -> None:
+        table = CompactHashTable[int]()
+        table.add("hello", 1)
+        table.add("world", 2)
+        self.assertEqual(table.find("hello"), 1)
+        self.assertIsNone(table.find("!"))
+
+        table.remove("hello")
+        self.assertIsNone(table.find("hello"))
+        self.assertEqual(table.find("world"), 2)
+
+        with self.assertRaises(KeyError):
+            table.remove("hello")
+
+    def test_hashable_keys(self) -> None:
+        table = CompactHashTable[str]()
+        table.add(-1, "int")
+        table.add((1, 2), "tuple")
+        table.add(b"bytes", "bytes")
+        self.assertEqual(table.find(-1), "int")
+        self.assertEqual(table.find((1, 2)), "tuple")
+        self.assertEqual(table.find(b"bytes"), "bytes")
+
+    def test_iteration_order(self) -> None:
+        table = CompactHashTable[int]()
+
+        for i in range(10):
+            table.add(str(i), i)
+
+        table.remove("3")
+        self.assertEqual(list(table), [0, 1, 2, 4, 5, 6, 7, 8, 9])
+
+    def test_resize(self) -> None:
+        table = CompactHashTable[int]()
+
+        for i in range(10000):
+            table.add(str(i), i)
+
+        self.assertEqual(len(table), 10000)
+        self.assertGreater(table.capacity, 10000)
+
+        for i in range(0, 10000, 2):
+            table.remove(str(i))
+
+        for i in range(10000, 20000):
+            table.add(str(i), i)
+
+        self.assertEqual(len(table), 15000)
+
+        for i in range(20000):
+            expected = None if i < 10000 and i % 2 == 0 else i
+            self.assertEqual(table.find(str(i)), expected)
+
+    def test_clear(self) -> None:
+        table = CompactHashTable[int](capacity=16)
+
+        for i in range(100):
+            table.add(str(i), i)
+
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.capacity, 16)
+        self.assertFalse(table.contains("1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+The module contains the ConcurrentHashTable test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import threading
+import unittest
+
+from typing import Optional
+
+from src.datastructpy import ConcurrentHashTable
+
+
+class TestConcurrentHashTable(unittest.TestCase):
+    def test_add_find_and_remove(self) -> None:
+        table = ConcurrentHashTable[int](shards=4)
+
+        for i in range(100):
+            table.add(i, i * 2)
+
+        self.assertEqual(len(table), 100)
+        self.assertEqual(table.find(10), 20)
+        self.assertTrue(table.contains(99))
+        self.assertEqual(sorted(table), [i * 2 for i in range(100)])
+
+        table.remove(10)
+        self.assertIsNone(table.find(10))
+        self.assertEqual(len(table), 99)
+
+        table.clear()
+        self.assertEqual(len(table), 0)
+
+    def test_get_or_add(self) -> None:
+        table = ConcurrentHashTable[int]()
+        self.assertEqual(table.get_or_add("a", lambda: 1), 1)
+        self.assertEqual(table.get_or_add("a", lambda: 2), 1)
+
+    def test_compute(self) -> None:
+        table = ConcurrentHashTable[int]()
+        table.compute("a", lambda value: (value or 0) + 1)
+        self.assertEqual(table.find("a"), 1)
+        self.assertIsNone(table.compute("a", lambda value: None))
+        self.assertFalse(table.contains("a"))
+
+    def test_concurrent_compute(self) -> None:
+        table = ConcurrentHashTable[int](shards=8)
+
+        def increment(value: Optional[int]) -> int:
+            return (value or 0) + 1
+
+        def work() -> None:
+            for i in range(1000):
+                table.compute(i % 10, increment)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(table), [800] * 10)
+
+    def test_invalid_shards(self) -> None:
+        with self.assertRaises(ValueError):
+            ConcurrentHashTable[int](shards=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ The module contains a test case for HashTable.
 
 import unittest
 
+from typing import List
+
 from src.datastructpy import HashTable
 
 
@@ -41,6 +43,234 @@ class TestHashTable(unittest.TestCase):
         table.remove("hello")
         self.assertIsNone(table.find("hello"))
 
+    def test_falsy_values(self) -> None:
+        table = HashTable[int]()
+        table.add("zero", 0)
+        self.assertTrue(table.contains("zero"))
+        self.assertIn("zero", table)
+        self.assertNotIn("one", table)
+
+    def test_getitem_and_get(self) -> None:
+        table = HashTable[int]()
+        table.add("hello", 1)
+        self.assertEqual(table["hello"], 1)
+        self.assertEqual(table.get("hello"), 1)
+        self.assertEqual(table.get("world", -1), -1)
+        self.assertIsNone(table.get("world"))
+
+        with self.assertRaises(KeyError):
+            # pylint: disable=pointless-statement
+            table["world"]
+
+    def test_views(self) -> None:
+        table = HashTable[int]()
+        table.add("a", 1)
+        table.add("b", 2)
+        keys, values, items = table.keys(), table.values(), table.items()
+        self.assertCountEqual(keys, ["a", "b"])
+        self.assertCountEqual(values, [1, 2])
+        self.assertCountEqual(items, [("a", 1), ("b", 2)])
+        self.assertIn("a", keys)
+        self.assertIn(2, values)
+        self.assertIn(("a", 1), items)
+        self.assertNotIn(("a", 2), items)
+
+        table.add("c", 3)
+        self.assertEqual(len(keys), 3)
+        self.assertIn(("c", 3), items)
+
+    def test_anagram_keys(self) -> None:
+        table = HashTable[int]()
+        table.add("ab", 1)
+        table.add("ba", 2)
+        self.assertEqual(table.find("ab"), 1)
+        self.assertEqual(table.find("ba"), 2)
+
+    def test_hashable_keys(self) -> None:
+        table = HashTable[str]()
+        table.add(1, "int")
+        table.add((1, 2), "tuple")
+        table.add(b"bytes", "bytes")
+        table.add(frozenset({3}), "frozenset")
+        self.assertEqual(table.find(1), "int")
+        self.assertEqual(table.find(1.0), "int")
+        self.assertEqual(table.find((1, 2)), "tuple")
+        self.assertEqual(table.find(b"bytes"), "bytes")
+        self.assertEqual(table.find(frozenset({3})), "frozenset")
+
+        with self.assertRaises(TypeError):
+            table.add([1], "list")  # type: ignore[arg-type]
+
+    def test_hash_computed_once(self) -> None:
+        class Key:
+            calls = 0
+
+            def __hash__(self) -> int:
+                Key.calls += 1
+                return 42
+
+        table = HashTable[int](capacity=2)
+        keys = [Key() for _ in range(100)]
+
+        for i, key in enumerate(keys):
+            table.add(key, i)
+
+        self.assertEqual(Key.calls, 100)
+        self.assertEqual(table.find(keys[50]), 50)
+
+    def test_resize(self) -> None:
+        table = HashTable[int](capacity=8, load_factor=0.75)
+
+        for i in range(1000):
+            table.add(str(i), i)
+
+        self.assertEqual(len(table), 1000)
+        self.assertGreaterEqual(table.capacity * table.load_factor, 1000)
+
+        for i in range(1000):
+            self.assertEqual(table.find(str(i)), i)
+
+        for i in range(1000):
+            table.remove(str(i))
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.capacity, 8)
+
+    def test_incremental_rehash(self) -> None:
+        table = HashTable[int](capacity=8, incremental=True, rehash_step=2)
+
+        for i in range(7):
+            table.add(str(i), i)
+
+        self.assertTrue(table.rehashing)
+        self.assertEqual(table.capacity, 16)
+        self.assertEqual(sorted(table), list(range(7)))
+
+        for i in range(7):
+            self.assertEqual(table.find(str(i)), i)
+
+        table.add("7", 7)
+        table.remove("0")
+        table.add("8", 8)
+        table.add("9", 9)
+        self.assertFalse(table.rehashing)
+        self.assertEqual(sorted(table), list(range(1, 10)))
+
+        for i in range(1, 10):
+            self.assertEqual(table.find(str(i)), i)
+
+    def test_incremental_resize(self) -> None:
+        table = HashTable[int](capacity=8, incremental=True, rehash_step=1)
+
+        for i in range(5000):
+            table.add(str(i), i)
+
+        self.assertEqual(len(table), 5000)
+        self.assertEqual(sorted(table), list(range(5000)))
+
+        for i in range(0, 5000, 2):
+            table.remove(str(i))
+
+        for i in range(5000):
+            expected = i if i % 2 else None
+            self.assertEqual(table.find(str(i)), expected)
+
+    def test_incremental_migration_bound(self) -> None:
+        for load_factor, rehash_step in ((0.75, 1), (0.5, 1), (0.05, 4)):
+            table = HashTable[int](
+                capacity=8,
+                load_factor=load_factor,
+                incremental=True,
+                rehash_step=rehash_step,
+            )
+            migrate = table._migrate
+            moved: List[int] = []
+
+            def record(count: int, table: HashTable[int] = table) -> None:
+                if table._old_buckets is not None:
+                    remaining = len(table._old_buckets) - table._rehash_index
+                    moved.append(min(count, remaining))
+
+                migrate(count)
+
+            table._migrate = record  # type: ignore[method-assign]
+
+            for i in range(20000):
+                table.add(i, i)
+
+            for i in range(20000):
+                table.remove(i)
+
+            self.assertGreater(len(moved), 0)
+            self.assertLessEqual(max(moved), 32 / load_factor)
+
+    def test_add_many(self) -> None:
+        table = HashTable[int](capacity=8)
+        table.add("0", -1)
+        table.add_many((str(i), i) for i in range(1000))
+        self.assertEqual(len(table), 1000)
+        self.assertEqual(table.find("0"), 0)
+
+        table.add_many({"a": 1, "b": 2, "999": 3})
+        self.assertEqual(len(table), 1002)
+        values = table.find_many(["a", "b", "999", "c"])
+        self.assertEqual(values, [1, 2, 3, None])
+        self.assertGreaterEqual(table.capacity * table.load_factor, 1002)
+
+    def test_remove_many(self) -> None:
+        table = HashTable[int](capacity=8, incremental=True)
+        table.add_many([(str(i), i) for i in range(1000)])
+
+        removed = table.remove_many(str(i) for i in range(1001))
+        self.assertEqual(removed, list(range(1000)) + [None])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.capacity, 8)
+
+        table = HashTable[int](capacity=64, incremental=True, rehash_step=1)
+        table.add_many([(str(i), i) for i in range(48)])
+        table.add("48", 48)
+        self.assertTrue(table.rehashing)
+
+        removed = table.remove_many(["0", "1", "x"])
+        self.assertEqual(removed, [0, 1, None])
+        self.assertTrue(table.rehashing)
+        self.assertEqual(sorted(table), list(range(2, 49)))
+
+    def test_stats(self) -> None:
+        table = HashTable[int](capacity=4)
+
+        for key in range(8, 20, 4):
+            table.add(key, key)
+
+        stats = table.stats()
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.capacity, 4)
+        self.assertEqual(stats.load_factor, 0.75)
+        self.assertEqual(stats.chain_lengths, {0: 3, 3: 1})
+        self.assertEqual(stats.max_chain_length, 3)
+        self.assertEqual(stats.mean_chain_length, 3)
+        self.assertEqual(stats.resizes, 0)
+
+        table.find(16)
+        table.find(0)
+        stats = table.stats()
+        self.assertEqual(stats.lookups, 2)
+        self.assertEqual(stats.probes, 6)
+        self.assertEqual(stats.mean_probes, 3)
+
+        table.add(20, 20)
+        self.assertEqual(table.stats().resizes, 1)
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            HashTable[int](capacity=0)
+
+        with self.assertRaises(ValueError):
+            HashTable[int](load_factor=0)
+
+        with self.assertRaises(ValueError):
+            HashTable[int](rehash_step=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -61,6 +61,30 @@ class TestLinkedList(unittest.TestCase):
         ll.remove(1)
         self.assertEqual(ll.first.value, 2)
 
+    def test_move_to_last(self) -> None:
+        ll = LinkedList[int]([1, 2, 3])
+        first = ll.first
+        assert first is not None
+        ll.move_to_last(first)
+        self.assertEqual(ll.to_list(), [2, 3, 1])
+        last = ll.last
+        assert last is not None
+        ll.move_to_last(last)
+        self.assertEqual(ll.to_list(), [2, 3, 1])
+        self.assertEqual(len(ll), 3)
+
+    def test_remove_node(self) -> None:
+        ll = LinkedList[int]([1, 2, 3])
+        node = ll.find(2)
+        assert node is not None
+        ll.remove_node(node)
+        self.assertEqual(ll.to_list(), [1, 3])
+        self.assertEqual(len(ll), 2)
+        self.assertIsNone(node.list)
+
+        with self.assertRaises(ValueError):
+            ll.remove_node(node)
+
     def test_remove_first(self) -> None:
         ll = LinkedList[int]([1, 2, 3, 4, 5])
         self.assertEqual(ll.first.value, 1)
@@ -0,0 +1,104 @@
+"""
+The module contains the LRUCache test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import unittest
+
+from src.datastructpy import LRUCache, memoize
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_and_put(self) -> None:
+        cache = LRUCache[int]()
+        cache.put("a", 1)
+        cache.put("b", 0)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("b"), 0)
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.get("c", -1), -1)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 2)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = LRUCache[int](max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertTrue(cache.contains("a"))
+        self.assertFalse(cache.contains("b"))
+        self.assertTrue(cache.contains("c"))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_evicts_by_weight(self) -> None:
+        cache = LRUCache[str](max_weight=10, weigher=len)
+        cache.put("a", "aaaa")
+        cache.put("b", "bbbb")
+        cache.put("c", "cccc")
+        self.assertFalse(cache.contains("a"))
+        self.assertEqual(cache.weight, 8)
+
+        cache.put("d", "d" * 11)
+        self.assertFalse(cache.contains("d"))
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl(self) -> None:
+        clock = FakeClock()
+        cache = LRUCache[int](ttl=10, clock=clock)
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=20)
+        clock.now = 15
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_remove_and_clear(self) -> None:
+        cache = LRUCache[int]()
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.remove("a")
+        self.assertFalse(cache.contains("a"))
+
+        with self.assertRaises(KeyError):
+            cache.remove("a")
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_memoize(self) -> None:
+        calls = []
+
+        @memoize(max_size=2)
+        def square(value: int) -> int:
+            calls.append(value)
+            return value * value
+
+        self.assertEqual(square(2), 4)
+        self.assertEqual(square(2), 4)
+        self.assertEqual(square(value=3), 9)
+        self.assertEqual(calls, [2, 3])
+        self.assertEqual(square.cache.hits, 1)  # type: ignore[attr-defined]
+
+    def test_memoize_keyword_arguments(self) -> None:
+        @memoize()
+        def arguments(*args: object, **kwargs: object) -> int:
+            return len(args) + 10 * len(kwargs)
+
+        self.assertEqual(arguments((1,), frozenset({("x", 2)})), 2)
+        self.assertEqual(arguments(1, x=2), 11)
+        self.assertEqual(arguments(1, x=2), 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
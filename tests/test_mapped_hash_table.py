@@ -0,0 +1,89 @@
+"""
+The module contains the MappedHashTable test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+import stat
+import tempfile
+import unittest
+
+from typing import Any
+
+from src.datastructpy import HashTable, MappedHashTable
+
+
+class TestMappedHashTable(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "table.snapshot")
+
+    def test_save_and_find(self) -> None:
+        table = HashTable[Any]()
+        table.add("hello", 1)
+        table.add(b"bytes", [1, 2])
+        table.add(42, {"a": 0})
+        table.add("zero", 0)
+        table.save(self.path)
+
+        with MappedHashTable(self.path) as mapped:
+            self.assertEqual(len(mapped), 4)
+            self.assertEqual(mapped.find("hello"), 1)
+            self.assertEqual(mapped.find(b"bytes"), [1, 2])
+            self.assertEqual(mapped.find(42), {"a": 0})
+            self.assertTrue(mapped.contains("zero"))
+            self.assertFalse(mapped.contains("world"))
+            self.assertFalse(mapped.contains((1, 2)))
+            self.assertIsNone(mapped.find("world"))
+            self.assertCountEqual(list(mapped), [1, [1, 2], {"a": 0}, 0])
+
+    def test_many_keys(self) -> None:
+        table = HashTable[int](incremental=True)
+        table.add_many((i, i * 2) for i in range(5000))
+        table.save(self.path)
+
+        with MappedHashTable(self.path) as mapped:
+            self.assertEqual(len(mapped), 5000)
+
+            for i in range(5000):
+                self.assertEqual(mapped.find(i), i * 2)
+
+            self.assertIsNone(mapped.find(5000))
+
+    def test_file_mode(self) -> None:
+        table = HashTable[int]()
+        table.add("a", 1)
+        umask = os.umask(0o022)
+
+        try:
+            table.save(self.path)
+            self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+            os.chmod(self.path, 0o640)
+            table.save(self.path)
+            self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+        finally:
+            os.umask(umask)
+
+    def test_unsupported_key(self) -> None:
+        table = HashTable[int]()
+        table.add((1, 2), 3)
+
+        with self.assertRaises(TypeError):
+            table.save(self.path)
+
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), [])
+
+    def test_invalid_file(self) -> None:
+        for content in (b"\0" * 64, b"DSPYHT01", b""):
+            with open(self.path, "wb") as file:
+                file.write(content)
+
+            with self.assertRaises(ValueError):
+                MappedHashTable(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
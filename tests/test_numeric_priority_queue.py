@@ -0,0 +1,68 @@
+"""
+The module contains the NumericPriorityQueue test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import random
+import unittest
+
+from src.datastructpy import EmptyCollectionException, NumericPriorityQueue
+
+
+class TestNumericPriorityQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.queue = NumericPriorityQueue[str]()
+
+    def test_enqueue_and_dequeue(self) -> None:
+        self.queue.enqueue(3.5, "low")
+        self.queue.enqueue(1.0, "high")
+        self.queue.enqueue(2, "medium")
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual(self.queue.peek(), "high")
+        self.assertEqual(self.queue.peek_priority(), 1.0)
+        self.assertEqual(self.queue.dequeue(), "high")
+        self.assertEqual(self.queue.dequeue(), "medium")
+        self.assertEqual(self.queue.dequeue(), "low")
+
+        with self.assertRaises(EmptyCollectionException):
+            self.queue.dequeue()
+
+        with self.assertRaises(EmptyCollectionException):
+            self.queue.peek()
+
+    def test_enqueue_many(self) -> None:
+        priorities = [random.randint(-1000, 1000) for _ in range(500)]
+        queue = NumericPriorityQueue[int](
+            ((p, p) for p in priorities[:100]), typecode="q"
+        )
+        queue.enqueue_many([(p, p) for p in priorities[100:150]])
+        queue.enqueue_many((p, p) for p in priorities[150:])
+
+        self.assertEqual(queue.typecode, "q")
+        self.assertEqual(queue.dequeue_many(10), sorted(priorities)[:10])
+        self.assertEqual(list(queue.drain()), sorted(priorities)[10:])
+
+        with self.assertRaises(ValueError):
+            queue.dequeue_many(-1)
+
+    def test_invalid_priorities(self) -> None:
+        queue = NumericPriorityQueue[str](typecode="q")
+        queue.enqueue(1, "a")
+
+        with self.assertRaises(TypeError):
+            queue.enqueue_many([(2, "b"), (2.5, "c")])
+
+        self.assertEqual(len(queue), 1)
+
+        with self.assertRaises(ValueError):
+            NumericPriorityQueue[str](typecode="u")
+
+    def test_clear(self) -> None:
+        self.queue.enqueue(1, "a")
+        self.queue.clear()
+        self.assertEqual(len(self.queue), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
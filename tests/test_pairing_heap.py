@@ -0,0 +1,137 @@
+"""
+The module contains the PairingHeap test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import random
+import unittest
+
+from src.datastructpy import (
+    DefaultComparer,
+    EmptyCollectionException,
+    PairingHeap,
+)
+
+
+class ReverseComparer(DefaultComparer[int]):
+    def lt(self, value1: int, value2: int) -> bool:
+        return value1 > value2
+
+
+class TestPairingHeap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.heap = PairingHeap[int, str]()
+
+    def test_enqueue_and_dequeue(self) -> None:
+        self.heap.enqueue(3, "low")
+        self.heap.enqueue(1, "high")
+        self.heap.enqueue(2, "medium")
+        self.assertEqual(len(self.heap), 3)
+        self.assertEqual(self.heap.peek(), "high")
+        self.assertEqual(self.heap.dequeue(), "high")
+        self.assertEqual(self.heap.dequeue(), "medium")
+        self.assertEqual(self.heap.dequeue(), "low")
+
+        with self.assertRaises(EmptyCollectionException):
+            self.heap.dequeue()
+
+        with self.assertRaises(EmptyCollectionException):
+            self.heap.peek()
+
+    def test_meld(self) -> None:
+        other = PairingHeap[int, str]()
+        first = self.heap.enqueue(4, "d")
+        self.heap.enqueue(1, "a")
+        second = other.enqueue(3, "c")
+        other.enqueue(2, "b")
+
+        self.heap.meld(other)
+        self.assertEqual(len(self.heap), 4)
+        self.assertEqual(len(other), 0)
+        self.assertTrue(self.heap.contains(first))
+        self.assertTrue(self.heap.contains(second))
+        self.assertFalse(other.contains(second))
+
+        third = PairingHeap[int, str]()
+        third.meld(self.heap)
+        self.assertIs(second.heap, third)
+        third.decrease_priority(first, 0)
+        self.assertEqual([third.dequeue() for _ in range(4)], list("dabc"))
+
+        other.enqueue(5, "e")
+        self.assertEqual(other.dequeue(), "e")
+
+        with self.assertRaises(ValueError):
+            other.meld(other)
+
+        with self.assertRaises(ValueError):
+            reverse = PairingHeap[int, str]()
+            reverse.comparer = ReverseComparer()
+            other.meld(reverse)
+
+    def test_update_priority(self) -> None:
+        low = self.heap.enqueue(3, "low")
+        high = self.heap.enqueue(1, "high")
+        self.heap.enqueue(2, "medium")
+
+        self.heap.decrease_priority(low, 0)
+        self.assertEqual(low.priority, 0)
+        self.assertEqual(self.heap.peek(), "low")
+
+        with self.assertRaises(ValueError):
+            self.heap.decrease_priority(low, 5)
+
+        self.heap.update_priority(low, 5)
+        self.heap.update_priority(high, 4)
+        self.assertEqual(self.heap.dequeue(), "medium")
+        self.assertEqual(self.heap.dequeue(), "high")
+
+    def test_remove_and_clear(self) -> None:
+        handle = self.heap.enqueue(2, "b")
+        self.heap.enqueue(1, "a")
+        self.assertEqual(self.heap.remove(handle), "b")
+        self.assertFalse(self.heap.contains(handle))
+        self.assertIsNone(handle.heap)
+
+        with self.assertRaises(ValueError):
+            self.heap.remove(handle)
+
+        other = self.heap.enqueue(3, "c")
+        self.heap.clear()
+        self.assertEqual(len(self.heap), 0)
+        self.assertFalse(self.heap.contains(other))
+
+    def test_random_operations(self) -> None:
+        heaps = [PairingHeap[int, int]() for _ in range(4)]
+        handles = []
+
+        for _ in range(1000):
+            priority = random.randint(0, 1000)
+            handles.append(random.choice(heaps).enqueue(priority, priority))
+
+        for handle in random.sample(handles, 200):
+            heap = handle.heap
+            assert heap is not None
+            priority = random.randint(0, 1000)
+            heap.update_priority(handle, priority)
+            handle.value = priority
+
+        for handle in random.sample(handles, 100):
+            heap = handle.heap
+            assert heap is not None
+            heap.remove(handle)
+
+        for heap in heaps[1:]:
+            heaps[0].meld(heap)
+
+        expected = sorted(h.value for h in handles if h.heap is heaps[0])
+        self.assertEqual(len(heaps[0]), 900)
+
+        heaps[0].comparer = ReverseComparer()
+        actual = [heaps[0].dequeue() for _ in range(900)]
+        self.assertEqual(actual, expected[::-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,21 @@ The module contains the PriorityQueue test case.
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
 
+import random
 import unittest
 
-from src.datastructpy import EmptyCollectionException, PriorityQueue
+from typing import Dict
+
+from src.datastructpy import (
+    DefaultComparer,
+    EmptyCollectionException,
+    PriorityQueue,
+)
+
+
+class ReverseComparer(DefaultComparer[int]):
+    def lt(self, value1: int, value2: int) -> bool:
+        return value1 > value2
 
 
 class TestPriorityQueue(unittest.TestCase):
@@ -57,6 +69,145 @@ class TestPriorityQueue(unittest.TestCase):
         self.assertEqual(self.queue.dequeue(), "low")
         self.assertEqual(self.queue.dequeue(), "medium")
 
+    def test_random_order(self) -> None:
+        priorities = [random.randint(0, 100) for _ in range(500)]
+
+        for priority in priorities:
+            self.queue.enqueue(priority, str(priority))
+
+        result = [int(self.queue.dequeue()) for _ in range(500)]
+        self.assertEqual(result, sorted(priorities))
+
+    def test_custom_comparer(self) -> None:
+        priorities = [random.randint(0, 100) for _ in range(500)]
+        self.queue.comparer = ReverseComparer()
+
+        for priority in priorities:
+            self.queue.enqueue(priority, str(priority))
+
+        result = [int(self.queue.dequeue()) for _ in range(500)]
+        self.assertEqual(result, sorted(priorities, reverse=True))
+
+    def test_comparer_change_restores_order(self) -> None:
+        for priority in range(10):
+            self.queue.enqueue(priority, str(priority))
+
+        self.queue.comparer = ReverseComparer()
+        self.assertEqual(self.queue.dequeue(), "9")
+        self.assertEqual(self.queue.dequeue(), "8")
+
+        self.queue.comparer = DefaultComparer[int]()
+        self.assertEqual(self.queue.dequeue(), "0")
+
+    def test_init_from_items(self) -> None:
+        priorities = [random.randint(0, 100) for _ in range(500)]
+        queue = PriorityQueue[int, int]((p, p) for p in priorities)
+        self.assertEqual(len(queue), 500)
+        self.assertEqual(list(queue.drain()), sorted(priorities))
+        self.assertEqual(len(queue), 0)
+
+    def test_enqueue_many(self) -> None:
+        self.queue.comparer = ReverseComparer()
+        self.queue.enqueue_many([(1, "a"), (3, "c")])
+        self.queue.enqueue_many([(2, "b")])
+        self.queue.enqueue_many([(5, "e"), (4, "d"), (0, "z"), (6, "f")])
+        self.assertEqual(list(self.queue.drain()), list("fedcbaz"))
+
+    def test_dequeue_many(self) -> None:
+        self.queue.enqueue_many((p, str(p)) for p in range(10, 0, -1))
+        self.assertEqual(self.queue.dequeue_many(3), ["1", "2", "3"])
+        self.assertEqual(self.queue.dequeue_many(0), [])
+        self.assertEqual(len(self.queue.dequeue_many(100)), 7)
+
+        with self.assertRaises(ValueError):
+            self.queue.dequeue_many(-1)
+
+    def test_arity(self) -> None:
+        priorities = [random.randint(0, 100) for _ in range(500)]
+
+        for arity in (2, 3, 4, 8):
+            for comparer in (None, ReverseComparer()):
+                queue = PriorityQueue[int, int](arity=arity)
+
+                if comparer:
+                    queue.comparer = comparer
+
+                queue.enqueue_many((p, p) for p in priorities[:50])
+
+                for priority in priorities[50:]:
+                    queue.enqueue(priority, priority)
+
+                result = queue.dequeue_many(500)
+                expected = sorted(priorities, reverse=comparer is not None)
+                self.assertEqual(queue.arity, arity)
+                self.assertEqual(result, expected)
+
+        with self.assertRaises(ValueError):
+            PriorityQueue[int, int](arity=1)
+
+    def test_equal_priorities(self) -> None:
+        class Payload:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+        for arity in (2, 4):
+            for comparer in (None, ReverseComparer()):
+                queue = PriorityQueue[int, Payload](arity=arity)
+
+                if comparer:
+                    queue.comparer = comparer
+
+                queue.enqueue_many((i % 3, Payload(str(i))) for i in range(30))
+
+                for i in range(30, 60):
+                    queue.enqueue(i % 3, Payload(str(i)))
+
+                names = [int(p.name) for p in queue.drain()]
+                order = (2, 1, 0) if comparer else (0, 1, 2)
+                expected = [i for r in order for i in range(60) if i % 3 == r]
+                self.assertEqual(names, expected)
+
+    def test_unorderable_values(self) -> None:
+        for arity in (2, 4):
+            queue = PriorityQueue[int, Dict[str, int]](arity=arity)
+            queue.enqueue(1, {"a": 1})
+            queue.enqueue(1, {"b": 2})
+            queue.enqueue_many([(0, {"c": 3}), (1, {"d": 4})])
+            queue.enqueue(0, {"e": 5})
+
+            self.assertEqual(
+                list(queue.drain()),
+                [{"c": 3}, {"e": 5}, {"a": 1}, {"b": 2}, {"d": 4}],
+            )
+
+    def test_capacity(self) -> None:
+        priorities = [random.randint(0, 1000) for _ in range(500)]
+
+        for arity in (2, 4):
+            for comparer in (None, ReverseComparer()):
+                queue = PriorityQueue[int, int](arity=arity, capacity=10)
+
+                if comparer:
+                    queue.comparer = comparer
+
+                for priority in priorities[:250]:
+                    queue.enqueue(priority, priority)
+
+                queue.enqueue_many((p, p) for p in priorities[250:])
+
+                reverse = comparer is None
+                expected = sorted(priorities, reverse=reverse)[:10][::-1]
+                self.assertEqual(len(queue), 10)
+                self.assertEqual(queue.capacity, 10)
+                self.assertEqual(list(queue.drain()), expected)
+
+        items = ((p, p) for p in priorities)
+        queue = PriorityQueue[int, int](items, capacity=5)
+        self.assertEqual(list(queue.drain()), sorted(priorities)[-5:])
+
+        with self.assertRaises(ValueError):
+            PriorityQueue[int, int](capacity=0)
+
 
 if __name__ == "__main__":
     unittest.main()
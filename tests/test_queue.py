@@ -6,7 +6,13 @@ The module contains the Queue test case.
 
 import unittest
 
-from src.datastructpy import Queue
+from typing import List
+
+from src.datastructpy import (
+    EmptyCollectionException,
+    FullCollectionException,
+    Queue,
+)
 
 
 class TestQueue(unittest.TestCase):
@@ -58,6 +64,115 @@ class TestQueue(unittest.TestCase):
         self.assertFalse(q.contains(1))
         self.assertEqual(q[0], 2)
 
+    def test_ring_buffer(self) -> None:
+        q = Queue[int]()
+        expected = []
+
+        for i in range(1000):
+            q.enqeue(i)
+            expected.append(i)
+
+            if i % 3 == 0:
+                self.assertEqual(q.dequeue(), expected.pop(0))
+
+        self.assertEqual(list(q), expected)
+        self.assertEqual(q[0], expected[0])
+        self.assertEqual(q[-2], expected[-2])
+        self.assertEqual(q[10:20], expected[10:20])
+
+        with self.assertRaises(IndexError):
+            # pylint: disable=pointless-statement
+            q[len(expected)]
+
+        while len(q):
+            self.assertEqual(q.peek(), expected[0])
+            self.assertEqual(q.dequeue(), expected.pop(0))
+
+        with self.assertRaises(EmptyCollectionException):
+            q.dequeue()
+
+    def test_maxlen(self) -> None:
+        q = Queue[int]([1, 2, 3], maxlen=3)
+        self.assertTrue(q.full())
+        self.assertEqual(q.maxlen, 3)
+
+        with self.assertRaises(FullCollectionException):
+            q.enqeue(4)
+
+        self.assertEqual(q.dequeue(), 1)
+        q.enqeue(4)
+        self.assertEqual(list(q), [2, 3, 4])
+
+        q = Queue[int](list(range(10)), maxlen=3, overflow="overwrite")
+        self.assertEqual(list(q), [7, 8, 9])
+        q.enqeue(10)
+        self.assertEqual(q.peek(), 8)
+        self.assertEqual(len(q), 3)
+
+        with self.assertRaises(ValueError):
+            Queue[int](maxlen=0)
+
+        with self.assertRaises(ValueError):
+            Queue[int](overflow="block")
+
+    def test_batch_operations(self) -> None:
+        q = Queue[int]()
+        expected = []
+
+        for i in range(50):
+            batch = list(range(i * 10, i * 10 + i))
+            q.enqueue_many(iter(batch))
+            expected.extend(batch)
+            self.assertEqual(q.dequeue_many(i // 2), expected[: i // 2])
+            del expected[: i // 2]
+
+        self.assertEqual(list(q), expected)
+        self.assertEqual(q.dequeue_many(5), expected[:5])
+        self.assertEqual(list(q.drain()), expected[5:])
+        self.assertEqual(q.dequeue_many(5), [])
+
+        with self.assertRaises(ValueError):
+            q.dequeue_many(-1)
+
+    def test_batch_maxlen(self) -> None:
+        q = Queue[int]([1, 2], maxlen=4)
+
+        with self.assertRaises(FullCollectionException):
+            q.enqueue_many([3, 4, 5])
+
+        self.assertEqual(list(q), [1, 2])
+
+        q = Queue[int]([1, 2], maxlen=4, overflow="overwrite")
+        q.enqueue_many([3, 4, 5])
+        self.assertEqual(list(q), [2, 3, 4, 5])
+        q.enqueue_many(range(6, 20))
+        self.assertEqual(list(q), [16, 17, 18, 19])
+
+    def test_copy_depth(self) -> None:
+        q = Queue[List[int]]([[1], [2]])
+        shallow = q.copy()
+        deep = q.copy(deep=True)
+        self.assertIs(shallow[0], q[0])
+        self.assertIsNot(deep[0], q[0])
+        self.assertEqual(deep, shallow)
+
+    def test_snapshot(self) -> None:
+        q = Queue[int](list(range(10)))
+        snapshot = q.snapshot()
+        q.enqeue(10)
+        self.assertEqual(q.dequeue(), 0)
+        self.assertEqual(list(snapshot), list(range(10)))
+        self.assertEqual(list(q), list(range(1, 11)))
+
+        other = q.snapshot()
+        self.assertEqual(other.dequeue_many(5), [1, 2, 3, 4, 5])
+        other.enqueue_many([11, 12])
+        self.assertEqual(list(q), list(range(1, 11)))
+        self.assertEqual(list(other), list(range(6, 13)))
+
+        q.snapshot().clear()
+        self.assertEqual(len(q), 10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,8 @@ The module contains the Stack test case.
 
 import unittest
 
+from typing import List
+
 from src.datastructpy import Stack
 
 
@@ -39,6 +41,14 @@ class TestStack(unittest.TestCase):
         self.assertEqual(c, arr)
         self.assertNotEqual(id(c), id(arr))
 
+    def test_copy_depth(self) -> None:
+        s = Stack[List[int]]([[1], [2]])
+        shallow = s.copy()
+        deep = s.copy(deep=True)
+        self.assertIs(shallow[0], s[0])
+        self.assertIsNot(deep[0], s[0])
+        self.assertEqual(deep, shallow)
+
     def peek(self) -> None:
         s = Stack[int]([1, 2, 3, 4, 5])
         self.assertEqual(5, s.pop())
@@ -49,6 +59,38 @@ class TestStack(unittest.TestCase):
         self.assertEqual(5, s.pop())
         self.assertFalse(s.contains(5))
 
+    def test_batch_operations(self) -> None:
+        s = Stack[int]()
+        s.push_many(range(10))
+        self.assertEqual(len(s), 10)
+        self.assertEqual(s.pop_many(3), [9, 8, 7])
+        self.assertEqual(s.pop_many(0), [])
+        self.assertEqual(list(s.drain()), [6, 5, 4, 3, 2, 1, 0])
+        self.assertEqual(s.pop_many(3), [])
+
+        with self.assertRaises(ValueError):
+            s.pop_many(-1)
+
+    def test_snapshot(self) -> None:
+        s = Stack[int]([1, 2, 3])
+        snapshot = s.snapshot()
+        s.push(4)
+        self.assertEqual(list(snapshot), [1, 2, 3])
+        self.assertEqual(list(s), [1, 2, 3, 4])
+
+        snapshot.clear()
+        self.assertEqual(len(s), 4)
+
+        other = s.snapshot()
+        self.assertEqual(other.pop(), 4)
+        self.assertEqual(list(s), [1, 2, 3, 4])
+
+        drained = s.drain()
+        self.assertEqual(next(drained), 4)
+        during = s.snapshot()
+        self.assertEqual(list(drained), [3, 2, 1])
+        self.assertEqual(list(during), [1, 2, 3])
+
 
 if __name__ == "__main__":
     unittest.main()
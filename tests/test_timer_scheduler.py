@@ -0,0 +1,124 @@
+"""
+The module contains the TimerScheduler test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import random
+import unittest
+
+from src.datastructpy import TimerScheduler
+
+
+class TestTimerScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TimerScheduler[str](wheel_size=4, levels=2)
+
+    def test_advance(self) -> None:
+        self.scheduler.schedule(2.5, "c")
+        self.scheduler.schedule(1, "a")
+        self.scheduler.schedule(2, "b")
+        self.scheduler.schedule(100, "far")
+        self.assertEqual(len(self.scheduler), 4)
+
+        self.assertEqual(self.scheduler.advance(0.5), [])
+        self.assertEqual(self.scheduler.advance(2), ["a", "b"])
+        self.assertEqual(self.scheduler.advance(3), ["c"])
+        self.assertEqual(self.scheduler.advance(99.9), [])
+        self.assertEqual(self.scheduler.advance(1000), ["far"])
+        self.assertEqual(self.scheduler.time, 1000)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_past_deadline(self) -> None:
+        self.scheduler.advance(10)
+        handle = self.scheduler.schedule(5, "late")
+        self.assertEqual(self.scheduler.advance(10), ["late"])
+        self.assertFalse(handle.active)
+
+    def test_cancel(self) -> None:
+        first = self.scheduler.schedule(1, "a")
+        second = self.scheduler.schedule(50, "b")
+        self.scheduler.schedule(3, "c")
+
+        self.assertTrue(self.scheduler.cancel(first))
+        self.assertFalse(self.scheduler.cancel(first))
+        self.assertTrue(self.scheduler.cancel(second))
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.advance(100), ["c"])
+        self.assertFalse(self.scheduler.cancel(first))
+
+    def test_compaction(self) -> None:
+        scheduler = TimerScheduler[int](wheel_size=8, levels=2)
+        handles = [scheduler.schedule(i, i) for i in range(1, 200)]
+
+        for handle in handles[::2]:
+            scheduler.cancel(handle)
+
+        self.assertEqual(len(scheduler), 99)
+        self.assertEqual(scheduler.stored, 99)
+
+        for handle in handles[1:20:2]:
+            scheduler.cancel(handle)
+
+        self.assertEqual(len(scheduler), 89)
+        self.assertEqual(scheduler.stored, 99)
+        scheduler.clear()
+        self.assertEqual(len(scheduler), 0)
+        self.assertFalse(handles[1].active)
+        self.assertEqual(scheduler.advance(500), [])
+        self.assertEqual(scheduler.stored, 0)
+
+    def test_sparse_timers(self) -> None:
+        scheduler = TimerScheduler[int](wheel_size=16, levels=3)
+        deadlines = [3, 17, 255, 4096, 5000, 70000, 1_000_000]
+
+        for deadline in reversed(deadlines):
+            scheduler.schedule(deadline, deadline)
+
+        self.assertEqual(scheduler.advance(4095), deadlines[:3])
+        self.assertEqual(scheduler.advance(69999.5), deadlines[3:5])
+        self.assertEqual(scheduler.advance(2_000_000), deadlines[5:])
+        self.assertEqual(scheduler.time, 2_000_000)
+
+    def test_random_operations(self) -> None:
+        scheduler = TimerScheduler[int](resolution=0.5, wheel_size=8, levels=2)
+        deadlines = {}
+        handles = []
+        fired = []
+        now = 0.0
+
+        for index in range(2000):
+            deadline = now + random.uniform(0, 100)
+            deadlines[index] = deadline
+            handles.append(scheduler.schedule(deadline, index))
+
+            if random.random() < 0.6:
+                handle = random.choice(handles)
+
+                if scheduler.cancel(handle):
+                    del deadlines[handle.item]
+
+            if random.random() < 0.1:
+                now += random.uniform(0, 10)
+                batch = scheduler.advance(now)
+                self.assertEqual(batch, sorted(batch, key=deadlines.__getitem__))
+                self.assertTrue(all(deadlines[i] <= now for i in batch))
+                fired.extend(batch)
+
+        fired.extend(scheduler.advance(now + 1000))
+        self.assertEqual(sorted(fired), sorted(deadlines))
+        self.assertEqual(len(scheduler), 0)
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            TimerScheduler[int](resolution=0)
+
+        with self.assertRaises(ValueError):
+            TimerScheduler[int](wheel_size=1)
+
+        with self.assertRaises(ValueError):
+            TimerScheduler[int](compact_threshold=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+The module contains the TypedQueue test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import unittest
+
+from src.datastructpy import EmptyCollectionException, TypedQueue
+
+
+class TestTypedQueue(unittest.TestCase):
+    def test_enqueue_and_dequeue(self) -> None:
+        q = TypedQueue[int]("q", [1, 2, 3])
+        q.enqeue(4)
+        self.assertEqual(len(q), 4)
+        self.assertEqual(q.peek(), 1)
+        self.assertEqual(q.dequeue(), 1)
+        self.assertEqual(q[0], 2)
+        self.assertEqual(q[-1], 4)
+        self.assertFalse(q.contains(1))
+        self.assertTrue(q.contains(4))
+        self.assertEqual(list(q), [2, 3, 4])
+
+        q.clear()
+
+        with self.assertRaises(EmptyCollectionException):
+            q.dequeue()
+
+        with self.assertRaises(EmptyCollectionException):
+            q.peek()
+
+    def test_compaction(self) -> None:
+        q = TypedQueue[int]("l")
+        expected = []
+
+        for i in range(10000):
+            q.enqeue(i)
+            expected.append(i)
+
+            if i % 3:
+                self.assertEqual(q.dequeue(), expected.pop(0))
+
+        self.assertEqual(list(q), expected)
+        self.assertEqual(q.copy().tolist(), expected)
+        self.assertEqual(q.view().tolist(), expected)
+
+    def test_batch_operations(self) -> None:
+        q = TypedQueue[float]("d")
+        q.enqueue_many(range(10))
+        self.assertEqual(q.dequeue_many(3), [0.0, 1.0, 2.0])
+
+        with self.assertRaises(TypeError):
+            q.enqueue_many([1.0, "a"])  # type: ignore[list-item]
+
+        self.assertEqual(list(q.drain()), [3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+
+    def test_view(self) -> None:
+        q = TypedQueue[int]("i", range(3000))
+
+        for _ in range(2000):
+            q.dequeue()
+
+        with q.view() as view:
+            self.assertEqual(view.tolist(), list(range(2000, 3000)))
+
+            for _ in range(500):
+                q.dequeue()
+
+            with self.assertRaises(BufferError):
+                q.enqeue(1)
+
+        self.assertEqual(q.view().tolist(), list(range(2500, 3000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+The module contains the TypedStack test case.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import unittest
+
+from src.datastructpy import EmptyCollectionException, TypedStack
+
+
+class TestTypedStack(unittest.TestCase):
+    def test_push_and_pop(self) -> None:
+        s = TypedStack[int]("q", [1, 2, 3])
+        s.push(4)
+        self.assertEqual(len(s), 4)
+        self.assertEqual(s.peek(), 4)
+        self.assertEqual(s.pop(), 4)
+        self.assertEqual(s[0], 1)
+        self.assertTrue(s.contains(3))
+        self.assertFalse(s.contains(4))
+        self.assertEqual(s.typecode, "q")
+
+        s.clear()
+
+        with self.assertRaises(EmptyCollectionException):
+            s.pop()
+
+        with self.assertRaises(EmptyCollectionException):
+            s.peek()
+
+    def test_batch_operations(self) -> None:
+        s = TypedStack[float]("d")
+        s.push_many(range(10))
+        self.assertEqual(s.pop_many(3), [9.0, 8.0, 7.0])
+
+        with self.assertRaises(TypeError):
+            s.push_many([1.0, "a"])  # type: ignore[list-item]
+
+        self.assertEqual(len(s), 7)
+        self.assertEqual(list(s.drain()), [6.0, 5.0, 4.0, 3.0, 2.0, 1.0, 0.0])
+
+    def test_view(self) -> None:
+        s = TypedStack[int]("i", [1, 2, 3])
+
+        with s.view() as view:
+            self.assertEqual(view.tolist(), [1, 2, 3])
+            self.assertEqual(view.format, "i")
+
+            with self.assertRaises(BufferError):
+                s.push(4)
+
+        s.push(4)
+        self.assertEqual(bytes(s.view()), s.copy().tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()